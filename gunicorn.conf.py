@@ -5,21 +5,46 @@ import os
 host = os.getenv("GUNICORN_HOST", "127.0.0.1")
 port = os.getenv("GUNICORN_PORT", os.getenv("PORT", "8000"))
 bind = f"{host}:{port}"
-# Cap workers — the CPU*2+1 formula is too aggressive on small servers.
-# Default to 3; override with GUNICORN_WORKERS env var.
-workers = int(os.getenv("GUNICORN_WORKERS", min(multiprocessing.cpu_count() * 2 + 1, 3)))
-# Threads per worker. Default 1 = sync worker (legacy behavior).
-# Setting GUNICORN_THREADS > 1 flips worker_class to gthread, which
-# gives each worker N threads sharing the same process. Net concurrent
-# capacity = workers * threads. Memory cost is sub-linear in threads
-# (shared imports + per-thread stack), so threads is the cheaper lever
-# for I/O-bound Django request workloads.
-threads = int(os.getenv("GUNICORN_THREADS", "1"))
-if threads > 1:
-    worker_class = "gthread"
+# The API is I/O-bound (Postgres, LLM and scrape HTTP calls), so concurrency
+# comes from threads, not processes: the CPU*2+1 sync-worker heuristic only
+# multiplies RSS (every worker carries the full Django + model registry) and
+# context-switches. Default to one worker per core, still capped at 3 for
+# small servers; override with GUNICORN_WORKERS.
+workers = int(os.getenv("GUNICORN_WORKERS", min(multiprocessing.cpu_count(), 3)))
+# gthread gives each worker N threads sharing the same process. Net concurrent
+# capacity = workers * threads. Memory cost is sub-linear in threads (shared
+# imports + per-thread stack), so threads is the cheaper lever for I/O-bound
+# Django request workloads. GUNICORN_WORKER_CLASS=sync with
+# GUNICORN_THREADS=1 restores the legacy sync worker; if views go async, the
+# next step is uvicorn.workers.UvicornWorker.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+# Import the app once in the master and fork workers from it so code pages
+# stay shared copy-on-write instead of each worker re-importing Django.
+# No DB connection is opened at import time, but settings.py does run
+# setup_logfire() in the master, so with LOGFIRE_TOKEN set the exporter
+# state and its background threads are inherited by every worker;
+# post_fork below re-configures logfire per worker. GUNICORN_PRELOAD=false
+# opts out.
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() in ("1", "true", "yes")
+# Recycle each worker after a bounded number of requests so slow leaks can't
+# grow RSS forever; the jitter staggers restarts so workers don't all cycle
+# at once. GUNICORN_MAX_REQUESTS=0 disables recycling.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "10000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "1000"))
 timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
 graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
 keepalive = 5
 accesslog = "-"
 errorlog = "-"
 loglevel = "info"
+
+
+def post_fork(server, worker):
+    # With preload_app the master already configured logfire; give this
+    # worker its own exporter and span-processor threads. No-op when
+    # LOGFIRE_TOKEN is unset or the app wasn't preloaded.
+    if preload_app:
+        from job_hunting.logfire_setup import reinit_logfire_after_fork
+
+        reinit_logfire_after_fork()
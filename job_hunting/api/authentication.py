@@ -1,7 +1,7 @@
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
-from django.contrib.auth import get_user_model
 from drf_spectacular.extensions import OpenApiAuthenticationExtension
+from job_hunting.lib.query_string import query_api_key
 from job_hunting.models import ApiKey
 
 
@@ -36,18 +36,15 @@ class ApiKeyAuthentication(BaseAuthentication):
         if not api_key:
             return None
             
-        # Authenticate with API key
-        api_key_obj = ApiKey.authenticate(api_key)
-        if not api_key_obj:
+        # Authenticate with API key (shares the middleware's per-process cache)
+        authenticated = ApiKey.authenticate_with_user(api_key)
+        if not authenticated:
             raise AuthenticationFailed('Invalid API key')
-            
-        # Get the user
-        User = get_user_model()
-        try:
-            user = User.objects.get(id=api_key_obj.user_id)
-        except User.DoesNotExist:
+
+        api_key_obj, user = authenticated
+        if user is None:
             raise AuthenticationFailed('User associated with API key not found')
-            
+
         return (user, api_key_obj)
     
     def _extract_api_key(self, request):
@@ -65,7 +62,7 @@ class ApiKeyAuthentication(BaseAuthentication):
             return api_key_header
 
         # 3. Query parameter
-        api_key_param = request.GET.get("api_key", "")
+        api_key_param = query_api_key(request.META.get("QUERY_STRING", ""))
         if api_key_param.startswith("jh_"):
             return api_key_param
 
@@ -1,11 +1,14 @@
-from django.http import JsonResponse
-from django.contrib.auth import get_user_model
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpResponse
+from job_hunting.lib.query_string import query_api_key
 from job_hunting.models import ApiKey
 
 
 class OvercastHeaderMiddleware:
     """Stamp framework identifier on every response."""
 
+    __slots__ = ("get_response",)
+
     def __init__(self, get_response):
         self.get_response = get_response
 
@@ -15,9 +18,39 @@ class OvercastHeaderMiddleware:
         return response
 
 
-class ApiKeyAuthenticationMiddleware:
+# Paths that never take API-key auth. initialize/healthcheck are exact
+# endpoints (the healthcheck is the highest-RPS route, hit by the load
+# balancer), so they are a single frozenset hash lookup; the remaining
+# trees are matched with str.startswith on a tuple, which runs in C.
+_EXACT_SKIP = frozenset({"/api/v1/initialize/", "/api/v1/healthcheck/"})
+_PREFIX_SKIP = ("/admin/", "/static/", "/media/")
+
+# Scopes that satisfy each HTTP method, any one of which grants access.
+# Methods not listed (HEAD, OPTIONS, ...) require a scope no key can hold.
+_READ_SCOPES = frozenset(("read", "*"))
+_WRITE_SCOPES = frozenset(("write", "*"))
+_SCOPE_MAP = {
+    "GET": _READ_SCOPES,
+    "POST": _WRITE_SCOPES,
+    "PUT": _WRITE_SCOPES,
+    "PATCH": _WRITE_SCOPES,
+    "DELETE": _WRITE_SCOPES,
+}
+_NO_SCOPES = frozenset()
+
+# Constant 403 body for scope failures — preformatted so a rejected request
+# never touches the JSON encoder.
+_FORBIDDEN_BODY = b'{"errors":[{"detail":"Insufficient API key permissions"}]}'
+_FORBIDDEN_CONTENT_TYPE = "application/vnd.api+json"
+
+_BEARER = "Bearer "
+_BEARER_LEN = len(_BEARER)
+
+
+class ApiKeyMiddleware:
     """
-    Middleware to authenticate requests using API keys.
+    Middleware to authenticate requests using API keys and enforce the
+    key's scopes in the same pass.
 
     Looks for API key in:
     1. Authorization header: "Bearer jh_..."
@@ -25,100 +58,119 @@ class ApiKeyAuthenticationMiddleware:
     3. Query parameter: "api_key=jh_..."
     """
 
+    async_capable = True
+    sync_capable = True
+
+    # markcoroutinefunction() tags the instance itself: asgiref sets
+    # `_is_coroutine`, Python 3.12+'s inspect sets `_is_coroutine_marker`.
+    __slots__ = ("get_response", "_is_coroutine", "_is_coroutine_marker")
+
     def __init__(self, get_response):
         self.get_response = get_response
+        # Under ASGI the handler chain is async; run natively there instead
+        # of having Django wrap this middleware in a sync_to_async thread hop.
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
         # Skip API key auth for certain paths
-        skip_paths = [
-            "/api/v1/initialize/",
-            "/api/v1/healthcheck/",
-            "/admin/",
-            "/static/",
-            "/media/",
-        ]
-
-        if any(request.path.startswith(path) for path in skip_paths):
+        path = request.path
+        if path in _EXACT_SKIP or path.startswith(_PREFIX_SKIP):
             return self.get_response(request)
 
-        # Try to extract API key
+        # Try to extract API key. A request that already carries an
+        # authenticated session user (admin, browser UI) keeps it and skips
+        # the key lookup; the session check runs only once a key is present
+        # so key-less requests never force the lazy session user.
         api_key = self._extract_api_key(request)
 
-        if api_key:
-            # Authenticate with API key
-            api_key_obj = ApiKey.authenticate(api_key)
-            if api_key_obj:
-                # Set the user on the request
-                User = get_user_model()
-                try:
-                    user = User.objects.get(id=api_key_obj.user_id)
-                    request.user = user
-                    request.api_key = api_key_obj
-                except User.DoesNotExist:
-                    pass
+        if api_key and not self._has_session_user(request):
+            # Authenticate with API key (cached per-process for a short TTL,
+            # see ApiKey.authenticate_with_user)
+            forbidden = self._apply_auth(
+                request, ApiKey.authenticate_with_user(api_key)
+            )
+            if forbidden is not None:
+                return forbidden
 
         return self.get_response(request)
 
+    async def __acall__(self, request):
+        path = request.path
+        if path in _EXACT_SKIP or path.startswith(_PREFIX_SKIP):
+            return await self.get_response(request)
+
+        api_key = self._extract_api_key(request)
+
+        if api_key and not await self._ahas_session_user(request):
+            forbidden = self._apply_auth(
+                request, await ApiKey.aauthenticate_with_user(api_key)
+            )
+            if forbidden is not None:
+                return forbidden
+
+        return await self.get_response(request)
+
+    @staticmethod
+    def _has_session_user(request):
+        user = getattr(request, "user", None)
+        return user is not None and user.is_authenticated
+
+    @staticmethod
+    async def _ahas_session_user(request):
+        # request.user is a lazy object that would hit the session store
+        # synchronously; AuthenticationMiddleware provides auser() for ASGI.
+        auser = getattr(request, "auser", None)
+        if auser is None:
+            return False
+        return (await auser()).is_authenticated
+
+    def _apply_auth(self, request, authenticated):
+        """Attach the key's user to the request and return the 403 response
+        when the key lacks the scope for this method, else None."""
+        if authenticated:
+            api_key_obj, user = authenticated
+            if user is not None:
+                request.user = user
+                request.api_key = api_key_obj
+                # Check if the API key has required scopes for this endpoint
+                if not self._check_permissions(request.method, api_key_obj):
+                    return HttpResponse(
+                        _FORBIDDEN_BODY,
+                        status=403,
+                        content_type=_FORBIDDEN_CONTENT_TYPE,
+                    )
+        return None
+
     def _extract_api_key(self, request):
-        """Extract API key from various sources"""
+        """Extract API key from various sources, cheapest first. Returns as
+        soon as one source yields a `jh_` token."""
+        meta = request.META
         # 1. Authorization header
-        auth_header = request.META.get("HTTP_AUTHORIZATION", "")
-        if auth_header.startswith("Bearer "):
-            token = auth_header[7:]  # Remove 'Bearer ' prefix
+        auth_header = meta.get("HTTP_AUTHORIZATION")
+        if auth_header and auth_header.startswith(_BEARER):
+            token = auth_header[_BEARER_LEN:]
             if token.startswith("jh_"):
                 return token
 
         # 2. X-API-Key header
-        api_key_header = request.META.get("HTTP_X_API_KEY", "")
-        if api_key_header.startswith("jh_"):
+        api_key_header = meta.get("HTTP_X_API_KEY")
+        if api_key_header and api_key_header.startswith("jh_"):
             return api_key_header
 
-        # 3. Query parameter
-        api_key_param = request.GET.get("api_key", "")
-        if api_key_param.startswith("jh_"):
-            return api_key_param
+        # 3. Query parameter — scanned straight off the raw QUERY_STRING so
+        # the auth path never forces the full QueryDict parse of request.GET.
+        query_string = meta.get("QUERY_STRING")
+        if query_string:
+            api_key_param = query_api_key(query_string)
+            if api_key_param.startswith("jh_"):
+                return api_key_param
 
         return None
 
-
-class ApiKeyPermissionMiddleware:
-    """
-    Middleware to check API key scopes/permissions.
-    """
-
-    def __init__(self, get_response):
-        self.get_response = get_response
-
-    def __call__(self, request):
-        # Only check permissions if authenticated via API key
-        if hasattr(request, "api_key") and request.api_key:
-            # Check if the API key has required scopes for this endpoint
-            if not self._check_permissions(request):
-                return JsonResponse(
-                    {"errors": [{"detail": "Insufficient API key permissions"}]},
-                    status=403,
-                )
-
-        return self.get_response(request)
-
-    def _check_permissions(self, request):
+    def _check_permissions(self, method, api_key):
         """Check if API key has required permissions for the request"""
-        api_key = request.api_key
-
-        # Define scope requirements for different endpoints
-        scope_map = {
-            "GET": ["read", "*"],
-            "POST": ["write", "*"],
-            "PUT": ["write", "*"],
-            "PATCH": ["write", "*"],
-            "DELETE": ["write", "*"],
-        }
-
-        required_scopes = scope_map.get(request.method, [])
-
-        # Check if API key has any of the required scopes
-        for scope in required_scopes:
-            if api_key.has_scope(scope):
-                return True
-
-        return False
+        return bool(_SCOPE_MAP.get(method, _NO_SCOPES) & api_key.scope_set)
@@ -1,6 +1,43 @@
-from rest_framework.renderers import JSONRenderer
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils import encoders
+
+# Anything orjson can't encode natively (Decimal, lazy translation strings,
+# querysets, ...) is handed to DRF's encoder so the output matches what the
+# stock JSONRenderer would produce. Datetimes are passed through as well:
+# DRF trims them to milliseconds and writes UTC as "Z", orjson does neither.
+_FALLBACK_ENCODER = encoders.JSONEncoder()
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _dumps(data):
+    return orjson.dumps(data, default=_FALLBACK_ENCODER.default, option=_ORJSON_OPTIONS)
+
+
+class VndApiJSONRenderer(BaseRenderer):
+    """Machine-only JSON:API renderer: always compact UTF-8 straight from
+    orjson, with none of JSONRenderer's indent / ensure_ascii handling.
+    Human-readable output is what the browsable API is for."""
 
-class VndApiJSONRenderer(JSONRenderer):
     media_type = 'application/vnd.api+json'
     format = 'vnd.api+json'
     charset = None  # JSON:API forbids charset parameter
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return _dumps(data)
+
+
+class OrjsonJSONRenderer(JSONRenderer):
+    """application/json twin of VndApiJSONRenderer. Compact responses are
+    encoded by orjson; an explicit indent (the browsable API, or
+    `Accept: application/json; indent=N`) still goes through DRF so the
+    pretty-printed output is unchanged."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return _dumps(data)
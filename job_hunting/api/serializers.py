@@ -1,9 +1,24 @@
+import re
 from datetime import date, datetime, timezone
+from decimal import Decimal
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, Dict, List
+from uuid import UUID
 
-import dateparser
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.core.exceptions import FieldDoesNotExist
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import (
+    DateField,
+    DecimalField,
+    OuterRef,
+    Q,
+    Subquery,
+    UUIDField,
+    prefetch_related_objects,
+)
 from rest_framework import serializers
 
 from job_hunting.models import (
@@ -12,15 +27,115 @@ from job_hunting.models import (
     Answer, JobApplication, CoverLetter, Experience, Resume, Score, Scrape,
     ExperienceDescription, ResumeSkill, ResumeSummary, JobApplicationStatus,
     Project, ResumeProject, ResumeExperience, ResumeEducation, ResumeCertification,
-    AiUsage, Waitlist, Invitation, ScrapeProfile,
+    AiUsage, Waitlist, Invitation, ScrapeProfile, Profile,
 )
 from job_hunting.models.job_post_dedupe import find_apply_url_matches
 
+# Resolved once: get_user_model() walks the app registry on every call.
+User = get_user_model()
+
+
+# type(val) -> converter, or None for values emitted as-is. Seeded with the
+# common cases; any other type is classified on first sight so every later
+# call is a single dict hit instead of an isinstance() walk. Decimal and
+# UUID become what DRF's encoder would make of them (float / str), so the
+# renderer never has to call back into Python for them.
+_PRIMITIVE_DISPATCH: Dict[type, Any] = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    Decimal: float,
+    UUID: str,
+    str: None,
+    int: None,
+    bool: None,
+    float: None,
+    type(None): None,
+}
+_UNSEEN = object()
+
 
 def _to_primitive(val):
-    if isinstance(val, (datetime, date)):
-        return val.isoformat()
-    return val
+    t = type(val)
+    fn = _PRIMITIVE_DISPATCH.get(t, _UNSEEN)
+    if fn is _UNSEEN:
+        fn = _PRIMITIVE_DISPATCH[t] = t.isoformat if issubclass(t, date) else None
+    return val if fn is None else fn(val)
+
+
+@lru_cache(maxsize=256)
+def _attributes_builder(names: tuple):
+    """Return `build(obj) -> {name: _to_primitive(obj.<name>)}` for a fixed
+    tuple of attribute names. One C-level attrgetter fetches every value,
+    instead of a getattr() call per name inside a dict comprehension.
+    Cached per distinct name tuple (a class's attributes or a fieldset)."""
+    if not names:
+        return lambda obj: {}
+    get = attrgetter(*names)
+    if len(names) == 1:
+        (name,) = names
+        return lambda obj: {name: _to_primitive(get(obj))}
+    return lambda obj: dict(zip(names, map(_to_primitive, get(obj))))
+
+
+# Two arbitrary reference times. A string that parses to the same value
+# against both doesn't depend on "now" and its result can be cached.
+_DATEPARSER_PROBE_BASES = (datetime(2001, 2, 3, 4, 5, 6), datetime(2011, 12, 13, 14, 15, 16))
+_RELATIVE = object()
+
+
+@lru_cache(maxsize=4096)
+def _dateparser_absolute(s: str):
+    """dateparser result for `s` when it is absolute, else _RELATIVE.
+    Relative inputs ("now", "2 days ago", "March 5" without a year) are
+    flagged so the caller re-parses them against the real clock."""
+    import dateparser
+
+    first, second = (
+        dateparser.parse(s, settings={"RELATIVE_BASE": base})
+        for base in _DATEPARSER_PROBE_BASES
+    )
+    return first if first == second else _RELATIVE
+
+
+def _dateparser_parse(s: str):
+    """dateparser.parse with repeated absolute inputs served from an LRU
+    cache (batch imports resend the same timestamps). datetimes are
+    immutable, so sharing cached results is safe."""
+    dt = _dateparser_absolute(s)
+    if dt is _RELATIVE:
+        import dateparser
+
+        dt = dateparser.parse(s)
+    return dt
+
+
+# "YYYY-MM-DD" and "YYYY-MM-DD[T ]HH:MM[...]" — the shapes API clients
+# send. Matching them up front routes each string straight to the right
+# C-level fromisoformat. The datetime pattern only anchors the prefix, so
+# a string fromisoformat rejects ("... 10:30 AM", "... UTC") still goes
+# on to dateparser; only a bare date that fromisoformat rejects (month
+# 13, Feb 30) is final.
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_ISO_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}")
+
+
+def _iso_datetime(s: str):
+    """datetime.fromisoformat(s) for a string matching the ISO shapes above;
+    None when fromisoformat rejects it (out-of-range fields, or a trailing
+    zone name / AM-PM it doesn't understand)."""
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        return None
+
+
+def _dateparser_fallback(s: str):
+    # Free-form input only; dateparser is imported on first use and can
+    # raise on pathological strings, which count as unparseable.
+    try:
+        return _dateparser_parse(s)
+    except Exception:
+        return None
 
 
 def _parse_date(val):
@@ -28,15 +143,16 @@ def _parse_date(val):
         return None
     if isinstance(val, (datetime, date)):
         return val.date() if isinstance(val, datetime) else val
-    try:
-        return date.fromisoformat(str(val))
-    except Exception:
-        pass
-    try:
-        dt = dateparser.parse(str(val))
-        return dt.date() if dt else None
-    except Exception:
-        return None
+    s = str(val)
+    if _ISO_DATE_RE.fullmatch(s):
+        try:
+            return date.fromisoformat(s)
+        except ValueError:
+            return None
+    dt = _iso_datetime(s) if _ISO_DATETIME_RE.match(s) else None
+    if dt is None:
+        dt = _dateparser_fallback(s)
+    return dt.date() if dt else None
 
 
 def _parse_datetime(val):
@@ -47,16 +163,20 @@ def _parse_datetime(val):
         if val.tzinfo is not None:
             val = val.astimezone(timezone.utc).replace(tzinfo=None)
         return val
-    try:
-        dt = dateparser.parse(str(val))
-        if dt and dt.tzinfo is not None:
-            # Convert to UTC and make naive
-            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
-        return dt
-    except Exception:
-        return None
+    s = str(val)
+    if _ISO_DATE_RE.fullmatch(s):
+        dt = _iso_datetime(s)
+    else:
+        dt = _iso_datetime(s) if _ISO_DATETIME_RE.match(s) else None
+        if dt is None:
+            dt = _dateparser_fallback(s)
+    if dt and dt.tzinfo is not None:
+        # Convert to UTC and make naive
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
 
 
+@lru_cache(maxsize=None)
 def _pluralize_type(t: str) -> str:
     # Minimal pluralization for our resource type names
     if t.endswith("y") and not t.endswith(("ay", "ey", "iy", "oy", "uy")):
@@ -75,6 +195,7 @@ ROUTE_PREFIX_BY_TYPE = {
 }
 
 
+@lru_cache(maxsize=None)
 def _resource_base_path(t: str) -> str:
     # Assumes your API is mounted at /api/v1/
     if t in ROUTE_PREFIX_BY_TYPE:
@@ -82,6 +203,171 @@ def _resource_base_path(t: str) -> str:
     return f"/api/v1/{_pluralize_type(t)}"
 
 
+_USER_RELATED_PREFIX = _resource_base_path("user") + "/"
+
+
+class LazyLoadError(RuntimeError):
+    """A to-one relationship ran SQL while its linkage was being built.
+    Only raised with settings.SERIALIZER_RAISE_ON_LAZY_LOAD on."""
+
+
+def _related_target_id(obj, attr, owner_type, rel_name):
+    """Id of the to-one target loaded through `obj.<attr>`, or None. Used
+    when no FK column is declared (e.g. a property-backed relationship).
+
+    With SERIALIZER_RAISE_ON_LAZY_LOAD on, any query the read fires is
+    recorded and reported as a LazyLoadError, so a missing select_related
+    surfaces in development rather than as an N+1 in production. Queries are
+    recorded rather than blocked because properties like Score.company
+    swallow exceptions raised underneath them."""
+    if not settings.SERIALIZER_RAISE_ON_LAZY_LOAD:
+        try:
+            target = getattr(obj, attr, None)
+        except Exception:
+            target = None
+        return getattr(target, "id", None) if target is not None else None
+
+    fired = []
+
+    def record(execute, sql, params, many, context):
+        fired.append(sql)
+        return execute(sql, params, many, context)
+
+    with connections[obj._state.db or DEFAULT_DB_ALIAS].execute_wrapper(record):
+        try:
+            target = getattr(obj, attr, None)
+        except Exception:
+            target = None
+    if fired:
+        raise LazyLoadError(
+            f"{owner_type}.{rel_name} lazy-loaded during serialization "
+            f"({len(fired)} queries, first: {fired[0]})"
+        )
+    return getattr(target, "id", None) if target is not None else None
+
+
+def _to_one_linkage(target_id, rel_type, self_link, related_prefix):
+    if target_id is None:
+        return {"data": None, "links": {"self": self_link}}
+    tid = str(target_id)
+    return {
+        "data": {"type": rel_type, "id": tid},
+        "links": {"self": self_link, "related": related_prefix + tid},
+    }
+
+
+def _attribute_expr(cls, name):
+    """Source for reading attribute `name` in a compiled _dump, specialized
+    on the model field behind it: date/datetime columns call isoformat()
+    directly, decimal/UUID columns keep _to_primitive's conversion, other
+    plain columns are emitted as read (_to_primitive would pass them
+    through unchanged), and anything else (properties, relations,
+    annotations) goes through _to_primitive. A column holding an unexpected
+    type raises AttributeError, which sends the row down the reflective
+    path."""
+    try:
+        field = cls.model._meta.get_field(name)
+    except (AttributeError, FieldDoesNotExist):
+        field = None
+    if field is None or field.is_relation or not field.concrete or field.attname != name:
+        return f"_to_primitive(obj.{name})"
+    if isinstance(field, DateField):
+        return f"(None if (_v := obj.{name}) is None else _v.isoformat())"
+    if isinstance(field, (DecimalField, UUIDField)):
+        return f"_to_primitive(obj.{name})"
+    return f"obj.{name}"
+
+
+def _forward_fk_column(model, attr):
+    """FK column behind a to-one relationship attribute (e.g. "duplicate_of"
+    -> "duplicate_of_id") when `attr` is a concrete forward ForeignKey /
+    OneToOneField to the target's primary key, else None. Its value is the
+    linkage id, so the related row needn't be loaded to emit it."""
+    try:
+        field = model._meta.get_field(attr)
+    except (AttributeError, FieldDoesNotExist):
+        return None
+    if (field.many_to_one or field.one_to_one) and field.concrete:
+        if field.target_field.primary_key:
+            return field.attname
+    return None
+
+
+def _compile_resource_dump(cls):
+    """Generate a `_dump(obj)` specialized to one serializer class.
+
+    Emits the request-independent part of BaseSerializer.to_resource (type,
+    id, every declared attribute, self link, relationship links, to-one
+    linkage and any injected `user_fk` linkage) as straight-line attribute
+    reads with the URL prefixes baked in as constants, instead of re-walking
+    `attributes` / `relationships` with getattr and f-strings for every row
+    of a list response. Returns None for classes without a `type` (abstract
+    bases)."""
+    if not isinstance(getattr(cls, "type", None), str):
+        return None
+    base = cls._base_path
+    attrs = ", ".join(
+        f"{name!r}: {_attribute_expr(cls, name)}" for name in cls.attributes
+    )
+    lines = [
+        # The helpers are bound as keyword-only defaults so the body reads
+        # them as locals rather than global lookups per row.
+        "def _dump(obj, *, _to_primitive=_to_primitive,"
+        " _related_target_id=_related_target_id,"
+        " _to_one_linkage=_to_one_linkage,"
+        " _USER_RELATED_PREFIX=_USER_RELATED_PREFIX):",
+        "    sid = str(obj.id)",
+        f"    base = {base + '/'!r} + sid",
+        "    res = {",
+        f"        'type': {cls.type!r},",
+        "        'id': sid,",
+        f"        'attributes': {{{attrs}}},",
+        "        'links': {'self': base},",
+    ]
+    if cls.relationships:
+        lines.append("        'relationships': {")
+        for (
+            rel_name, attr, rel_type, uselist, fk_field, related_prefix,
+            self_suffix, related_suffix,
+        ) in cls._rels:
+            self_link = f"base + {self_suffix!r}"
+            if uselist:
+                lines.append(
+                    f"            {rel_name!r}: {{'links': {{'self': {self_link}, "
+                    f"'related': base + {related_suffix!r}}}}},"
+                )
+                continue
+            target = f"_related_target_id(obj, {attr!r}, {cls.type!r}, {rel_name!r})"
+            if fk_field:
+                target = f"_fk if (_fk := obj.{fk_field}) is not None else {target}"
+            lines.append(
+                f"            {rel_name!r}: _to_one_linkage({target}, {rel_type!r}, "
+                f"{self_link}, {related_prefix!r}),"
+            )
+        lines.append("        },")
+    lines.append("    }")
+    if cls._inject_user_rel:
+        lines += [
+            f"    if _uid := obj.{cls.user_fk}:",
+            "        _suid = str(_uid)",
+            "        res.setdefault('relationships', {})['user'] = {",
+            "            'data': {'type': 'user', 'id': _suid},",
+            "            'links': {'self': base + '/relationships/user',",
+            "                      'related': _USER_RELATED_PREFIX + _suid},",
+            "        }",
+        ]
+    lines.append("    return res")
+    namespace = {
+        "_USER_RELATED_PREFIX": _USER_RELATED_PREFIX,
+        "_to_primitive": _to_primitive,
+        "_related_target_id": _related_target_id,
+        "_to_one_linkage": _to_one_linkage,
+    }
+    # Source is built solely from the class's own declarations, never input.
+    exec(compile("\n".join(lines), f"<{cls.__name__}._dump>", "exec"), namespace)  # noqa: S102
+    return namespace["_dump"]
+
+
 class BaseSerializer:
     type: str
     model: Any
@@ -95,6 +381,10 @@ class BaseSerializer:
     read_only_attributes: List[str] = []
     relationships: Dict[str, Dict[str, Any]] = {}
     relationship_fks: Dict[str, str] = {}
+    # Legacy relationship names accepted on input only (parse_payload), e.g.
+    # "job_post" for "job-post". Kept out of relationship_fks so output and
+    # include resolution only ever see declared relationship names.
+    relationship_fk_aliases: Dict[str, str] = {}
     # Legacy slim translation table. The wire `?slim=true` flag is
     # being retired in favor of JSON:API sparse-fieldsets
     # (`?fields[<type>]=...`). For the deprecation window, this list
@@ -121,6 +411,90 @@ class BaseSerializer:
     # that don't opt in are unaffected).
     list_select_related: tuple = ()
     list_prefetch_related: tuple = ()
+    # Per-class specialized dump of the request-independent resource body,
+    # generated once when the subclass is defined (see
+    # _compile_resource_dump). None falls back to the reflective path.
+    _dump_fn = None
+    # URL constants derived from `type` / `relationships`, fixed per class:
+    # this resource's collection path and each relationship target's.
+    _base_path: str = ""
+    _rel_base_paths: Dict[str, str] = {}
+    # `relationships` flattened once per class into
+    # (rel_name, attr, rel_type, uselist, fk_field, related_prefix,
+    #  self_suffix, related_suffix) tuples, plus rel_name -> rel_type for the
+    # to-many ones, so per-row loops unpack tuples instead of re-reading each
+    # cfg dict. The suffixes are the constant tails of the relationship's
+    # self / related links ("/relationships/<rel>", "/<rel>"), so a link is
+    # one concatenation onto the row's path rather than an f-string build.
+    _rels: tuple = ()
+    _to_many_types: Dict[str, str] = {}
+    # rel_name -> (attr, type, uselist), for lookups of one relationship by
+    # name (get_related, linked_relationships) without re-reading its cfg.
+    _rel_meta: Dict[str, tuple] = {}
+    # True when `user_fk` must add the user linkage itself, i.e. the class
+    # doesn't already declare a to-one "user" relationship (which emits the
+    # identical linkage, read from the same FK column).
+    _inject_user_rel: bool = False
+    # `attributes` minus `read_only_attributes`, in declared order: the
+    # attribute keys parse_payload copies from a payload.
+    _writable_attributes: tuple = ()
+    # (rel_name, fk_field) pairs parse_payload reads: relationship_fks, then
+    # relationship_fk_aliases.
+    _payload_fks: tuple = ()
+    # JSON:API `type` values parse_payload accepts: the type and its plural,
+    # unless a subclass declares its own set.
+    _accepted_types: frozenset = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if isinstance(getattr(cls, "type", None), str):
+            cls._base_path = _resource_base_path(cls.type)
+            if "_accepted_types" not in cls.__dict__:
+                cls._accepted_types = frozenset({cls.type, _pluralize_type(cls.type)})
+        cls._rel_base_paths = {
+            rel_name: _resource_base_path(cfg["type"])
+            for rel_name, cfg in cls.relationships.items()
+        }
+        cls._rels = tuple(
+            (
+                rel_name,
+                cfg["attr"],
+                cfg["type"],
+                cfg.get("uselist", True),
+                cls.relationship_fks.get(rel_name)
+                or (cls.user_fk if rel_name == "user" else None)
+                or (
+                    None
+                    if cfg.get("uselist", True)
+                    else _forward_fk_column(getattr(cls, "model", None), cfg["attr"])
+                ),
+                cls._rel_base_paths[rel_name] + "/",
+                "/relationships/" + rel_name,
+                "/" + rel_name,
+            )
+            for rel_name, cfg in cls.relationships.items()
+        )
+        cls._rel_meta = {
+            rel_name: (attr, rel_type, uselist)
+            for rel_name, attr, rel_type, uselist, *_rest in cls._rels
+        }
+        cls._to_many_types = {
+            rel_name: rel_type
+            for rel_name, _, rel_type, uselist, *_links in cls._rels
+            if uselist
+        }
+        user_cfg = cls.relationships.get("user")
+        cls._inject_user_rel = bool(cls.user_fk) and (
+            user_cfg is None or user_cfg.get("uselist", True)
+        )
+        read_only = set(cls.read_only_attributes)
+        cls._writable_attributes = tuple(
+            a for a in cls.attributes if a not in read_only
+        )
+        cls._payload_fks = tuple(cls.relationship_fks.items()) + tuple(
+            cls.relationship_fk_aliases.items()
+        )
+        cls._dump_fn = staticmethod(_compile_resource_dump(cls))
 
     @classmethod
     def optimize_queryset(cls, qs):
@@ -134,6 +508,19 @@ class BaseSerializer:
             qs = qs.prefetch_related(*cls.list_prefetch_related)
         return qs
 
+    def to_resource_many(self, objs) -> List[Dict[str, Any]]:
+        """Serialize already-fetched rows (typically one page of a list).
+        Loads this serializer's list_select_related / list_prefetch_related
+        lookups for all of them up front with prefetch_related_objects(), one
+        query per lookup, so the per-row to_resource() reads cached relations
+        instead of lazy-loading each one. Relations the rows already carry
+        (e.g. from optimize_queryset or select_related) are not refetched."""
+        objs = list(objs)
+        lookups = self.list_select_related + self.list_prefetch_related
+        if objs and lookups:
+            prefetch_related_objects(objs, *lookups)
+        return list(map(self.to_resource, objs))
+
     def set_parent_context(self, parent_type: str, parent_id: int, rel_name: str):
         self._parent_context = {
             "parent_type": parent_type,
@@ -142,7 +529,7 @@ class BaseSerializer:
         }
 
     def accepted_types(self):
-        return {self.type, _pluralize_type(self.type)}
+        return self._accepted_types
 
     def _requested_fieldset(self):
         """Return the explicit attribute list from `fields[<type>]`, or None
@@ -215,46 +602,109 @@ class BaseSerializer:
             # ResumeSerializer.slim_attributes is already in attributes.
             declared = set(self.attributes)
             fieldset = [a for a in self.slim_attributes if a in declared]
-        attrs_to_emit = self.attributes if fieldset is None else fieldset
+        res = None
+        dumped = False
+        if fieldset is None and self._dump_fn is not None:
+            # Optimistic fast path; anything the generated reads can't
+            # satisfy (e.g. a missing FK column) falls back to the
+            # reflective build below, which tolerates it.
+            try:
+                res = self._dump_fn(obj)
+                dumped = True
+            except AttributeError:
+                res = None
+        if res is None:
+            attrs_to_emit = self.attributes if fieldset is None else fieldset
+            res = self._build_resource(obj, attrs_to_emit)
+        # The resource body already holds str(obj.id) and the row's path;
+        # reuse them for the links below instead of re-stringifying.
+        obj_path = res["links"]["self"]
+        # rel_name -> to-many linkage built for ?include=, reused by the
+        # linked_relationships pass so a rel in both is fetched once.
+        linkages = {}
+        if self.relationships:
+            # JSON:API spec: emitting `data` for a to-many asserts the
+            # complete linkage. Only emit when the client requested
+            # this relationship via `?include=` — i.e. when we are
+            # sideloading the items anyway. Without the linkage,
+            # Ember Data refetches via the related link even though
+            # the records are already in `included`. With it, the
+            # client resolves the sideload from one round trip.
+            rel_out = res["relationships"]
+            to_many_types = self._to_many_types
+            for rel_name in self._requested_includes():
+                rel_type = to_many_types.get(rel_name)
+                if rel_type is None:
+                    continue
+                try:
+                    _, items = self.get_related(obj, rel_name)
+                    linkage = [
+                        {"type": rel_type, "id": str(item.id)} for item in items
+                    ]
+                except Exception:
+                    continue
+                rel_out[rel_name]["data"] = linkages[rel_name] = linkage
+        # Auto-inject user relationship linkage when user_fk is declared
+        # and no "user" relationship already emits it (_dump_fn covers the
+        # fast path).
+        if self._inject_user_rel and not dumped:
+            fk_value = getattr(obj, self.user_fk, None)
+            if fk_value:
+                res.setdefault("relationships", {})["user"] = {
+                    "data": {"type": "user", "id": str(fk_value)},
+                    "links": {
+                        "self": obj_path + "/relationships/user",
+                        "related": _USER_RELATED_PREFIX + str(fk_value),
+                    },
+                }
+        # Auto-populate data linkage for declared linked_relationships
+        if not self.slim and self.linked_relationships:
+            for rel_name in self.linked_relationships:
+                meta = self._rel_meta.get(rel_name)
+                if meta is None:
+                    continue
+                rel_type = meta[1]
+                linkage = linkages.get(rel_name)
+                if linkage is None:
+                    try:
+                        _, items = self.get_related(obj, rel_name)
+                        linkage = [{"type": rel_type, "id": str(item.id)} for item in items]
+                    except Exception:
+                        linkage = []
+                existing_links = res.get("relationships", {}).get(rel_name, {}).get("links", {
+                    "self": obj_path + "/relationships/" + rel_name,
+                    "related": obj_path + "/" + rel_name,
+                })
+                res.setdefault("relationships", {})[rel_name] = {
+                    "data": linkage,
+                    "links": existing_links,
+                }
+        return res
+
+    def _build_resource(self, obj, attrs_to_emit) -> Dict[str, Any]:
+        """Reflective construction of what _dump_fn emits: type, id, the
+        given attributes, self link and relationship links / to-one
+        linkage. Used for sparse fieldsets and as the fast path's fallback."""
         res = {
             "type": self.type,
             "id": str(obj.id),
-            "attributes": {k: _to_primitive(getattr(obj, k)) for k in attrs_to_emit},
+            "attributes": _attributes_builder(tuple(attrs_to_emit))(obj),
         }
         # JSON:API resource self link
-        res["links"] = {"self": f"{_resource_base_path(self.type)}/{obj.id}"}
+        obj_path = self._base_path + "/" + res["id"]
+        res["links"] = {"self": obj_path}
         if self.relationships:
-            included_rels = self._requested_includes()
             rel_out = {}
-            for rel_name, cfg in self.relationships.items():
-                rel_attr = cfg["attr"]
-                rel_type = cfg["type"]
-                uselist = cfg.get("uselist", True)
-
+            for (
+                rel_name, rel_attr, rel_type, uselist, fk_field, related_prefix,
+                self_suffix, related_suffix,
+            ) in self._rels:
                 if uselist:
-                    # Map relationship name to URL segment for special cases
-                    rel_segment = rel_name
                     links = {
-                        "self": f"{_resource_base_path(self.type)}/{obj.id}/relationships/{rel_name}",
-                        "related": f"{_resource_base_path(self.type)}/{obj.id}/{rel_segment}",
+                        "self": obj_path + self_suffix,
+                        "related": obj_path + related_suffix,
                     }
-                    rel_payload: Dict[str, Any] = {"links": links}
-                    # JSON:API spec: emitting `data` for a to-many asserts the
-                    # complete linkage. Only emit when the client requested
-                    # this relationship via `?include=` — i.e. when we are
-                    # sideloading the items anyway. Without the linkage,
-                    # Ember Data refetches via the related link even though
-                    # the records are already in `included`. With it, the
-                    # client resolves the sideload from one round trip.
-                    if rel_name in included_rels:
-                        try:
-                            _, items = self.get_related(obj, rel_name)
-                            rel_payload["data"] = [
-                                {"type": rel_type, "id": str(item.id)} for item in items
-                            ]
-                        except Exception:
-                            pass
-                    rel_out[rel_name] = rel_payload
+                    rel_out[rel_name] = {"links": links}
                 else:
                     # Determine target_id, preferring the declared FK column so
                     # we never trigger a per-row lazy load of the related object
@@ -264,16 +714,12 @@ class BaseSerializer:
                     # loading obj.<attr> when no FK is declared (e.g. a property-
                     # backed relationship like Score.company).
                     target_id = None
-                    fk_field = self.relationship_fks.get(rel_name)
                     if fk_field:
                         target_id = getattr(obj, fk_field, None)
                     if target_id is None:
-                        try:
-                            target = getattr(obj, rel_attr, None)
-                        except Exception:
-                            target = None
-                        if target is not None and getattr(target, "id", None) is not None:
-                            target_id = target.id
+                        target_id = _related_target_id(
+                            obj, rel_attr, self.type, rel_name
+                        )
 
                     data = (
                         {"type": rel_type, "id": str(target_id)}
@@ -281,73 +727,79 @@ class BaseSerializer:
                         else None
                     )
                     links = {
-                        "self": f"{_resource_base_path(self.type)}/{obj.id}/relationships/{rel_name}",
+                        "self": obj_path + self_suffix,
                     }
                     # Include related link if we have a target_id (even when target is None)
                     if target_id is not None:
-                        links["related"] = (
-                            f"{_resource_base_path(rel_type)}/{target_id}"
-                        )
+                        links["related"] = related_prefix + str(target_id)
                     rel_out[rel_name] = {"data": data, "links": links}
             res["relationships"] = rel_out
-        # Auto-inject user relationship linkage when user_fk is declared
-        if self.user_fk:
-            fk_value = getattr(obj, self.user_fk, None)
-            if fk_value:
-                res.setdefault("relationships", {})["user"] = {
-                    "data": {"type": "user", "id": str(fk_value)},
-                    "links": {
-                        "self": f"{_resource_base_path(self.type)}/{obj.id}/relationships/user",
-                        "related": f"{_resource_base_path('user')}/{fk_value}",
-                    },
-                }
-        # Auto-populate data linkage for declared linked_relationships
-        if not self.slim and self.linked_relationships:
-            for rel_name in self.linked_relationships:
-                rel_cfg = self.relationships.get(rel_name)
-                if not rel_cfg:
-                    continue
-                rel_type = rel_cfg["type"]
-                try:
-                    _, items = self.get_related(obj, rel_name)
-                    linkage = [{"type": rel_type, "id": str(item.id)} for item in items]
-                except Exception:
-                    linkage = []
-                existing_links = res.get("relationships", {}).get(rel_name, {}).get("links", {
-                    "self": f"{_resource_base_path(self.type)}/{obj.id}/relationships/{rel_name}",
-                    "related": f"{_resource_base_path(self.type)}/{obj.id}/{rel_name}",
-                })
-                res.setdefault("relationships", {})[rel_name] = {
-                    "data": linkage,
-                    "links": existing_links,
-                }
         return res
 
+    def _load_users(self, ids) -> Dict[int, Any]:
+        """Bulk-fetch users by id into this serializer's cache with one
+        in_bulk() query for whichever ids aren't cached yet. Ids that match
+        no user are cached as None. The cache lives on the instance, so it
+        is scoped to the request that built the serializer."""
+        cache = self.__dict__.setdefault("_user_cache", {})
+        missing = {i for i in ids if i and i not in cache}
+        if missing:
+            found = User.objects.in_bulk(missing)
+            for user_id in missing:
+                cache[user_id] = found.get(user_id)
+        return cache
+
+    def _link_values(self, link_model, parent_field, parent_id, child_field, value_field):
+        """child id -> `value_field` for every `link_model` join row of one
+        parent (e.g. each ResumeSkill's `active` for a resume), loaded with
+        one query the first time a child renders under that parent instead
+        of one link lookup per child. Where a child has several links the
+        oldest wins, as .first() did. Cached on the instance, so it is
+        scoped to the request that built the serializer."""
+        cache = self.__dict__.setdefault("_link_maps", {})
+        key = (link_model, parent_id)
+        values = cache.get(key)
+        if values is None:
+            values = {}
+            rows = (
+                link_model.objects.filter(**{parent_field: parent_id})
+                .order_by("pk")
+                .values_list(child_field, value_field)
+            )
+            for child_id, value in rows:
+                values.setdefault(child_id, value)
+            cache[key] = values
+        return values
+
+    def _resolve_user(self, obj):
+        fk_value = getattr(obj, self.user_fk, None)
+        if not fk_value:
+            return "user", []
+        user = self._load_users((fk_value,)).get(fk_value)
+        return "user", [user] if user is not None else []
+
     def get_related(self, obj, rel_name):
         # Auto-resolve user relationship when user_fk is declared
         if rel_name == "user" and self.user_fk:
-            fk_value = getattr(obj, self.user_fk, None)
-            if fk_value:
-                User = get_user_model()
-                try:
-                    return "user", [User.objects.get(id=fk_value)]
-                except User.DoesNotExist:
-                    return "user", []
-            return "user", []
-        cfg = self.relationships.get(rel_name)
-        if not cfg:
+            return self._resolve_user(obj)
+        meta = self._rel_meta.get(rel_name)
+        if meta is None:
             return None, []
-        attr = cfg["attr"]
-        rel_type = cfg["type"]
-        uselist = cfg.get("uselist", True)
+        attr, rel_type, uselist = meta
         target = getattr(obj, attr, None)
         if target is None:
             return rel_type, []
-        # Handle Django Managers (reverse FK / M2M) by calling .all()
+        if not uselist:
+            return rel_type, [target]
+        # Django Managers (reverse FK / M2M): hand back the lazy QuerySet
+        # rather than copying it into a list. It evaluates once, on first
+        # iteration or truthiness check, and later passes reuse its result
+        # cache, so callers can still test it and iterate it repeatedly.
         if hasattr(target, "all"):
-            target = target.all()
-        items = list(target) if uselist else [target]
-        return rel_type, items
+            return rel_type, target.all()
+        if isinstance(target, (list, tuple)):
+            return rel_type, target
+        return rel_type, list(target)
 
     def parse_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         if not isinstance(payload, dict) or "data" not in payload:
@@ -360,28 +812,30 @@ class BaseSerializer:
         attrs_in = data.get("attributes", {}) or {}
         out: Dict[str, Any] = {}
 
-        read_only = set(self.read_only_attributes)
-        for k in self.attributes:
-            if k in attrs_in and k not in read_only:
+        for k in self._writable_attributes:
+            if k in attrs_in:
                 out[k] = attrs_in[k]
         rels = data.get("relationships", {}) or {}
-        for rel_name, fk_field in self.relationship_fks.items():
+        for rel_name, fk_field in self._payload_fks if rels else ():
             rel = rels.get(rel_name)
-            if rel and isinstance(rel.get("data"), dict):
+            if not rel:
+                continue
+            rel_data = rel.get("data")
+            if isinstance(rel_data, dict):
                 # Pass the JSON:API id through verbatim (as a string) — do
                 # NOT coerce to int. Relationship targets are mixed PK types
                 # post CC-77: NanoID string PKs (company/job-post/scrape) vs
                 # still-int PKs (user/status). Django coerces the string at
                 # the model-field layer on create()/save() either way.
-                out[fk_field] = str(rel["data"]["id"])
-            elif rel and rel.get("data") is None:
+                out[fk_field] = str(rel_data["id"])
+            elif rel_data is None:
                 out[fk_field] = None
         return out
 
 
 class DjangoUserSerializer:
     type = "user"
-    model = get_user_model()
+    model = User
 
     # Declared relationships drive both the per-rel links block and the
     # `?include=` gate. Mirrors the (rel_name, rel_type, url_segment)
@@ -394,9 +848,49 @@ class DjangoUserSerializer:
         ("job-applications", "job-application", "job-applications"),
         ("summaries", "summary", "summaries"),
     ]
+    _base_path = _resource_base_path("user")
+    _accepted_types = frozenset({"user", _pluralize_type("user")})
+    # _REL_DEFS with the constant self / related link tails precomputed.
+    _REL_LINKS = tuple(
+        (rel_name, rel_type, "/relationships/" + rel_name, "/" + url_segment)
+        for rel_name, rel_type, url_segment in _REL_DEFS
+    )
+
+    # Batched per-user data from prefetch(); None = look up per user.
+    _prefetch = None
+
+    @classmethod
+    def prefetch(cls, users, rel_names=()) -> Dict[str, Any]:
+        """Load the Profile rows and the given relationships for every user
+        in one query each, grouped by user id, so serializing N users costs
+        a bounded number of queries instead of 1 + len(rel_names) per user.
+        Hand the result to set_prefetch(); to_resource() and get_related()
+        then read from it instead of querying."""
+        users = list(users)
+        user_ids = [u.id for u in users]
+        by_id = {u.id: u for u in users}
+        profiles = {}
+        for prof in Profile.objects.filter(user_id__in=user_ids):
+            # Reuse the already-loaded user so profile_basics_complete()
+            # doesn't lazy-load it again per profile.
+            prof.user = by_id[prof.user_id]
+            profiles[prof.user_id] = prof
+        ctx: Dict[str, Any] = {"profiles": profiles}
+        for rel_name in rel_names:
+            qs = cls._related_queryset(rel_name)
+            if qs is None:
+                continue
+            grouped: Dict[Any, list] = {}
+            for item in qs.filter(user_id__in=user_ids):
+                grouped.setdefault(item.user_id, []).append(item)
+            ctx[rel_name] = grouped
+        return ctx
+
+    def set_prefetch(self, ctx: Dict[str, Any]):
+        self._prefetch = ctx
 
     def accepted_types(self):
-        return {self.type, _pluralize_type(self.type)}
+        return self._accepted_types
 
     def _requested_includes(self) -> set:
         """Parse the request's ?include= (and ?includes=) into the set
@@ -458,25 +952,22 @@ class DjangoUserSerializer:
         auto_score = False
         federate_posts = False
         federate_rich = False
-        prof = None
-        try:
-            from job_hunting.models import Profile
+        if self._prefetch is not None:
+            prof = self._prefetch["profiles"].get(obj.id)
+        else:
             prof = Profile.objects.filter(user_id=obj.id).first()
-            if prof:
-                phone = prof.phone or ""
-                is_guest = bool(getattr(prof, "is_guest", False))
-                linkedin = prof.linkedin or ""
-                github = prof.github or ""
-                address = prof.address or ""
-                links = prof.links if prof.links is not None else []
-                onboarding = prof.resolved_onboarding()
-                auto_score = bool(getattr(prof, "auto_score", False))
-                federate_posts = bool(getattr(prof, "federate_posts", False))
-                federate_rich = bool(getattr(prof, "federate_rich", False))
-        except Exception:
-            phone = ""
+        if prof is not None:
+            phone = prof.phone or ""
+            is_guest = prof.is_guest
+            linkedin = prof.linkedin or ""
+            github = prof.github or ""
+            address = prof.address or ""
+            links = prof.links if prof.links is not None else []
+            onboarding = prof.resolved_onboarding()
+            auto_score = prof.auto_score
+            federate_posts = prof.federate_posts
+            federate_rich = prof.federate_rich
         if onboarding is None:
-            from job_hunting.models import Profile
             onboarding = Profile.default_onboarding()
         # Derive `profile_basics` at read time so fresh signups aren't told
         # to fill in their name when they already did at signup. The other
@@ -519,7 +1010,8 @@ class DjangoUserSerializer:
             "id": str(obj.id),
             "attributes": all_attrs,
         }
-        res["links"] = {"self": f"{_resource_base_path(self.type)}/{obj.id}"}
+        obj_path = self._base_path + "/" + res["id"]
+        res["links"] = {"self": obj_path}
 
         # JSON:API: relationships objects hold `links` by default. The
         # `data` linkage array is only emitted when the client asked for
@@ -528,11 +1020,11 @@ class DjangoUserSerializer:
         # 250+ job-applications, etc) and violated the spec.
         included_rels = self._requested_includes()
         relationships = {}
-        for rel_name, rel_type, url_segment in self._REL_DEFS:
+        for rel_name, rel_type, self_suffix, related_suffix in self._REL_LINKS:
             rel_payload: Dict[str, Any] = {
                 "links": {
-                    "self": f"{_resource_base_path(self.type)}/{obj.id}/relationships/{rel_name}",
-                    "related": f"{_resource_base_path(self.type)}/{obj.id}/{url_segment}",
+                    "self": obj_path + self_suffix,
+                    "related": obj_path + related_suffix,
                 },
             }
             if rel_name in included_rels:
@@ -547,31 +1039,39 @@ class DjangoUserSerializer:
         res["relationships"] = relationships
         return res
 
-    def get_related(self, obj, rel_name):
+    # rel_name -> resource type for get_related(); querysets come from
+    # _related_queryset() so the per-user and batched paths share them.
+    _REL_TYPES = {rel_name: rel_type for rel_name, rel_type, _u in _REL_DEFS}
+
+    @staticmethod
+    def _related_queryset(rel_name):
         if rel_name == "resumes":
-            return "resume", list(Resume.objects.filter(user_id=obj.id))
+            return Resume.objects.all()
         elif rel_name == "scores":
             # CC-91: optimize so `users/<id>?include=scores` doesn't N+1 on the
             # per-row job_post/resume/company traversal in ScoreSerializer.
-            return "score", list(
-                ScoreSerializer.optimize_queryset(
-                    Score.objects.filter(user_id=obj.id)
-                )
-            )
+            return ScoreSerializer.optimize_queryset(Score.objects.all())
         elif rel_name == "cover-letters":
-            return "cover-letter", list(CoverLetter.objects.filter(user_id=obj.id))
+            return CoverLetter.objects.all()
         elif rel_name == "job-applications":
             # CC-91: optimize so `users/<id>?include=job-applications` doesn't
             # N+1 on the per-row FK + application-statuses traversal.
-            return "job-application", list(
-                JobApplicationSerializer.optimize_queryset(
-                    JobApplication.objects.filter(user_id=obj.id)
-                )
+            return JobApplicationSerializer.optimize_queryset(
+                JobApplication.objects.all()
             )
         elif rel_name == "summaries":
-            return "summary", list(Summary.objects.filter(user_id=obj.id))
-        else:
+            return Summary.objects.all()
+        return None
+
+    def get_related(self, obj, rel_name):
+        rel_type = self._REL_TYPES.get(rel_name)
+        if rel_type is None:
             return None, []
+        if self._prefetch is not None and rel_name in self._prefetch:
+            return rel_type, list(self._prefetch[rel_name].get(obj.id, ()))
+        return rel_type, list(
+            self._related_queryset(rel_name).filter(user_id=obj.id)
+        )
 
     def parse_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         # Accept both JSON:API and flat JSON payloads
@@ -678,10 +1178,7 @@ class ResumeSerializer(BaseSerializer):
         # Convenience attribute: active summary content. Respect
         # fields[resume] sparse-fieldsets — only emit when not filtered out.
         if self._field_requested("summary"):
-            try:
-                res.setdefault("attributes", {})["summary"] = obj.active_summary_content()
-            except Exception:
-                pass
+            res.setdefault("attributes", {})["summary"] = obj.active_summary_content()
         return res
 
     def _meta_counts_requested(self) -> bool:
@@ -697,10 +1194,6 @@ class ResumeSerializer(BaseSerializer):
         return "counts" in {s.strip() for s in str(raw).split(",") if s.strip()}
 
     def _build_counts(self, obj):
-        from job_hunting.models import ResumeExperience, ResumeSkill
-        from job_hunting.models.job_application import JobApplication
-        from job_hunting.models.score import Score
-
         rid = obj.id
         return {
             "job_application_count": JobApplication.objects.filter(resume_id=rid).count(),
@@ -777,29 +1270,32 @@ class ScoreSerializer(BaseSerializer):
 
     def to_resource(self, obj):
         res = super().to_resource(obj)
-        # Expose statuses merged with join attributes (created_at, note)
-        try:
-            statuses_out = []
-            for jas in list(getattr(obj, "application_statuses", []) or []):
-                st = getattr(jas, "status", None)
-                item = {
-                    "created_at": _to_primitive(getattr(jas, "created_at", None)),
-                    "note": getattr(jas, "note", None),
-                }
-                if st is not None:
-                    item.update(
-                        {
-                            "id": getattr(st, "id", None),
-                            "status": getattr(st, "status", None),
-                            "status_type": getattr(st, "status_type", None),
-                        }
-                    )
-                statuses_out.append(item)
-            if statuses_out:
-                res.setdefault("attributes", {})["statuses"] = statuses_out
-        except Exception:
-            # Non-fatal; omit statuses on error
-            pass
+        # Expose statuses merged with join attributes (created_at, note).
+        # Only present when the row carries them; a related manager is read
+        # through .all() so the prefetch cache is honored.
+        jas_rows = getattr(obj, "application_statuses", None)
+        if jas_rows is None:
+            return res
+        if hasattr(jas_rows, "all"):
+            jas_rows = jas_rows.all()
+        statuses_out = []
+        for jas in jas_rows:
+            st = getattr(jas, "status", None)
+            item = {
+                "created_at": _to_primitive(getattr(jas, "created_at", None)),
+                "note": getattr(jas, "note", None),
+            }
+            if st is not None:
+                item.update(
+                    {
+                        "id": getattr(st, "id", None),
+                        "status": getattr(st, "status", None),
+                        "status_type": getattr(st, "status_type", None),
+                    }
+                )
+            statuses_out.append(item)
+        if statuses_out:
+            res.setdefault("attributes", {})["statuses"] = statuses_out
         return res
 
 
@@ -1200,7 +1696,7 @@ class JobPostSerializer(BaseSerializer):
             rels = res.setdefault("relationships", {})
             existing = rels.get("top-score") or {}
             existing_links = existing.get("links") or {
-                "self": f"{_resource_base_path(self.type)}/{obj.id}/relationships/top-score",
+                "self": f"{self._base_path}/{obj.id}/relationships/top-score",
             }
             rels["top-score"] = {"data": None, "links": existing_links}
         return res
@@ -1490,6 +1986,9 @@ class CoverLetterSerializer(BaseSerializer):
         "resume": "resume_id",
         "job-post": "job_post_id",
     }
+    # `company` isn't a declared relationship (it may come via the job
+    # post), so its related-link prefix is precomputed here.
+    _COMPANY_RELATED_PREFIX = _resource_base_path("company") + "/"
 
     def to_resource(self, obj):
         res = super().to_resource(obj)
@@ -1505,22 +2004,12 @@ class CoverLetterSerializer(BaseSerializer):
         ):
             company_id = obj.job_post.company_id
 
-        if company_id:
-            res.setdefault("relationships", {})["company"] = {
-                "data": {"type": "company", "id": str(company_id)},
-                "links": {
-                    "self": f"{_resource_base_path(self.type)}/{obj.id}/relationships/company",
-                    "related": f"{_resource_base_path('company')}/{company_id}",
-                },
-            }
-        else:
-            # Include null relationship for consistency
-            res.setdefault("relationships", {})["company"] = {
-                "data": None,
-                "links": {
-                    "self": f"{_resource_base_path(self.type)}/{obj.id}/relationships/company",
-                },
-            }
+        res.setdefault("relationships", {})["company"] = _to_one_linkage(
+            company_id or None,
+            "company",
+            res["links"]["self"] + "/relationships/company",
+            self._COMPANY_RELATED_PREFIX,
+        )
         return res
 
 
@@ -1567,21 +2056,24 @@ class JobApplicationSerializer(BaseSerializer):
     list_prefetch_related = ("application_statuses__status",)
     relationship_fks = {
         "user": "user_id",
-        "users": "user_id",
         "job-post": "job_post_id",
+        "resume": "resume_id",
+        "company": "company_id",
+        "cover-letter": "cover_letter_id",
+    }
+    relationship_fk_aliases = {
+        "users": "user_id",
         "job_post": "job_post_id",
         "job-posts": "job_post_id",
-        "resume": "resume_id",
         "resumes": "resume_id",
-        "company": "company_id",
         "companies": "company_id",
-        "cover-letter": "cover_letter_id",
         "cover_letter": "cover_letter_id",
         "cover-letters": "cover_letter_id",
     }
 
-    def accepted_types(self):
-        return {"application", "applications", "job-application", "job-applications"}
+    _accepted_types = frozenset(
+        {"application", "applications", "job-application", "job-applications"}
+    )
 
     def parse_payload(self, payload):
         out = super().parse_payload(payload)
@@ -1610,18 +2102,15 @@ class SummarySerializer(BaseSerializer):
     def to_resource(self, obj):
         res = super().to_resource(obj)
         # If included under a resume, inject per-link 'active' from resume_summary
-        try:
-            ctx = getattr(self, "_parent_context", None)
-            if ctx and ctx.get("parent_type") == "resume":
-                resume_id = ctx.get("parent_id")
-                if resume_id:
-                    link = ResumeSummary.objects.filter(
-                        resume_id=resume_id, summary_id=obj.id
-                    ).first()
-                    if link and hasattr(link, "active"):
-                        res.setdefault("attributes", {})["active"] = bool(link.active)
-        except Exception:
-            pass
+        ctx = getattr(self, "_parent_context", None)
+        if ctx and ctx.get("parent_type") == "resume":
+            resume_id = ctx.get("parent_id")
+            if resume_id:
+                active = self._link_values(
+                    ResumeSummary, "resume_id", resume_id, "summary_id", "active"
+                )
+                if obj.id in active:
+                    res.setdefault("attributes", {})["active"] = bool(active[obj.id])
         return res
 
 
@@ -1641,32 +2130,52 @@ class ExperienceSerializer(BaseSerializer):
     relationship_fks = {"company": "company_id"}
     linked_relationships = ["descriptions"]
 
-    def _resume_id_for(self, obj):
-        """Which resume this experience renders under, for order lookup."""
-        ctx = getattr(self, "_parent_context", None)
-        if ctx and ctx.get("parent_type") == "resume":
-            return ctx.get("parent_id")
-        try:
-            if getattr(obj, "resumes", None):
-                return obj.resumes[0].id
-        except Exception:
-            pass
-        return None
+    def to_resource_many(self, objs):
+        """Load every experience's ordered descriptions with one join-table
+        query before serializing, instead of the two queries per row the
+        Experience.descriptions property runs for the linkage."""
+        objs = list(objs)
+        if objs and not self.slim:
+            by_exp = self.__dict__.setdefault("_descriptions", {})
+            ids = [o.id for o in objs if o.id not in by_exp]
+            for exp_id in ids:
+                by_exp[exp_id] = []
+            links = (
+                ExperienceDescription.objects.filter(experience_id__in=ids)
+                .select_related("description")
+                .order_by("experience_id", "order")
+            )
+            for link in links if ids else ():
+                by_exp[link.experience_id].append(link.description)
+        return super().to_resource_many(objs)
+
+    def get_related(self, obj, rel_name):
+        if rel_name == "descriptions":
+            loaded = self.__dict__.get("_descriptions", {}).get(obj.id)
+            if loaded is not None:
+                return "description", loaded
+        return super().get_related(obj, rel_name)
 
     def to_resource(self, obj):
         res = super().to_resource(obj)
         # Convenience link to related descriptions (non-relationships URL)
         res.setdefault("links", {})[
             "descriptions"
-        ] = f"{_resource_base_path(self.type)}/{obj.id}/descriptions"
-        rid = self._resume_id_for(obj)
+        ] = f"{self._base_path}/{obj.id}/descriptions"
+        # resume_id / order only make sense under a resume; callers listing
+        # under one set the parent context, so no per-row resume lookup.
+        # The standalone /experiences/ endpoints omit both (an experience can
+        # sit on several resumes) — as before: the old `obj.resumes[0]`
+        # fallback read an attribute Experience doesn't define.
+        ctx = getattr(self, "_parent_context", None)
+        rid = ctx.get("parent_id") if ctx and ctx.get("parent_type") == "resume" else None
         if rid is not None:
             res.setdefault("attributes", {})["resume_id"] = rid
-            row = ResumeExperience.objects.filter(
-                resume_id=rid, experience_id=obj.id
-            ).first()
-            if row is not None:
-                res.setdefault("attributes", {})["order"] = row.order
+            order = self._link_values(
+                ResumeExperience, "resume_id", rid, "experience_id", "order"
+            )
+            if obj.id in order:
+                res["attributes"]["order"] = order[obj.id]
         return res
 
     def parse_payload(self, payload):
@@ -1724,19 +2233,20 @@ class DescriptionSerializer(BaseSerializer):
     def to_resource(self, obj):
         res = super().to_resource(obj)
         # If included under an experience, inject per-link 'order' from the join table
-        try:
-            ctx = getattr(self, "_parent_context", None)
-            if ctx and ctx.get("parent_type") == "experience":
-                experience_id = ctx.get("parent_id")
-                if experience_id:
-                    link = ExperienceDescription.objects.filter(
-                        experience_id=int(experience_id), description_id=obj.id
-                    ).first()
-                    if link and hasattr(link, "order"):
-                        res.setdefault("attributes", {})["order"] = link.order
-        except Exception:
-            # Non-fatal; omit 'order' if unavailable
-            pass
+        ctx = getattr(self, "_parent_context", None)
+        if ctx and ctx.get("parent_type") == "experience":
+            try:
+                experience_id = int(ctx.get("parent_id") or 0)
+            except (TypeError, ValueError):
+                # Non-fatal; omit 'order' if unavailable
+                experience_id = 0
+            if experience_id:
+                order = self._link_values(
+                    ExperienceDescription, "experience_id", experience_id,
+                    "description_id", "order",
+                )
+                if obj.id in order:
+                    res.setdefault("attributes", {})["order"] = order[obj.id]
         return res
 
 
@@ -1748,18 +2258,15 @@ class SkillSerializer(BaseSerializer):
     def to_resource(self, obj):
         res = super().to_resource(obj)
         # If included under a resume, expose per-link 'active' from resume_skill join
-        try:
-            ctx = getattr(self, "_parent_context", None)
-            if ctx and ctx.get("parent_type") == "resume":
-                resume_id = ctx.get("parent_id")
-                if resume_id:
-                    link = ResumeSkill.objects.filter(
-                        resume_id=resume_id, skill_id=obj.id
-                    ).first()
-                    if link and hasattr(link, "active"):
-                        res.setdefault("attributes", {})["active"] = bool(link.active)
-        except Exception:
-            pass
+        ctx = getattr(self, "_parent_context", None)
+        if ctx and ctx.get("parent_type") == "resume":
+            resume_id = ctx.get("parent_id")
+            if resume_id:
+                active = self._link_values(
+                    ResumeSkill, "resume_id", resume_id, "skill_id", "active"
+                )
+                if obj.id in active:
+                    res.setdefault("attributes", {})["active"] = bool(active[obj.id])
         return res
 
 
@@ -1790,13 +2297,10 @@ class JobApplicationStatusSerializer(BaseSerializer):
     def to_resource(self, obj):
         res = super().to_resource(obj)
         # Inline the status label so timeline consumers don't need ?include=status
-        try:
+        if obj.status_id is not None:
             status_obj = obj.status
-            if status_obj is not None:
-                res["attributes"]["status"] = status_obj.status
-                res["attributes"]["status_type"] = status_obj.status_type
-        except Exception:
-            pass
+            res["attributes"]["status"] = status_obj.status
+            res["attributes"]["status_type"] = status_obj.status_type
         return res
 
 
@@ -1854,52 +2358,64 @@ class QuestionSerializer(BaseSerializer):
         "answers": {"attr": "answers", "type": "answer", "uselist": True},
     }
     relationship_fks = {
-        # Accept multiple relationship keys for application
         "application": "application_id",
+        "company": "company_id",
+        "user": "created_by_id",
+        "job-post": "job_post_id",
+    }
+    relationship_fk_aliases = {
+        # Accept multiple relationship keys for application
         "job-application": "application_id",
         "job-applications": "application_id",
         "job_application": "application_id",
         "job_applications": "application_id",
-        "company": "company_id",
-        "user": "created_by_id",
-        "job-post": "job_post_id",
         "job_post": "job_post_id",
     }
 
+    @staticmethod
+    def latest_answer_content():
+        """Content of the question's newest answer, as a correlated subquery
+        so the database picks it instead of Python scanning every answer.
+        List views annotate their page with it as `latest_answer_content`,
+        which to_resource_many / to_resource then read as-is."""
+        return Subquery(
+            Answer.objects.filter(question_id=OuterRef("pk"))
+            .order_by("-created_at", "-id")
+            .values("content")[:1]
+        )
+
+    def to_resource_many(self, objs):
+        """Stamp latest_answer_content on every row with one query before
+        serializing, so to_resource doesn't look up answers per question."""
+        objs = list(objs)
+        missing = [o.pk for o in objs if "latest_answer_content" not in o.__dict__]
+        if missing:
+            latest = dict(
+                Question.objects.filter(pk__in=missing)
+                .annotate(latest_answer_content=self.latest_answer_content())
+                .values_list("pk", "latest_answer_content")
+            )
+            for o in objs:
+                if o.pk in latest:
+                    o.latest_answer_content = latest[o.pk]
+        return super().to_resource_many(objs)
+
     def to_resource(self, obj):
         res = super().to_resource(obj)
 
         # Backward-compatible: expose latest answer content as an attribute
-        try:
-            latest_content = None
-            try:
-                answers = list(Answer.objects.filter(question_id=obj.id).order_by("created_at"))
-            except Exception:
-                answers = []
-            if answers:
-                try:
-                    latest = max(
-                        answers,
-                        key=lambda a: (
-                            getattr(a, "created_at", None) or datetime.min,
-                            getattr(a, "id", 0) or 0,
-                        ),
-                    )
-                except Exception:
-                    latest = answers[-1]
-                latest_content = getattr(latest, "content", None)
-
-            # Fallback to legacy column if present and no child answers yet
-            if not latest_content:
-                legacy = getattr(obj, "answer", None)
-                if legacy:
-                    latest_content = legacy
+        if "latest_answer_content" in obj.__dict__:
+            latest_content = obj.latest_answer_content
+        else:
+            latest_content = (
+                Answer.objects.filter(question_id=obj.id)
+                .order_by("-created_at", "-id")
+                .values_list("content", flat=True)
+                .first()
+            )
 
-            if latest_content is not None:
-                res.setdefault("attributes", {})["answer"] = latest_content
-        except Exception:
-            # Non-fatal; omit 'answer' on error
-            pass
+        if latest_content is not None:
+            res.setdefault("attributes", {})["answer"] = latest_content
         return res
 
     def parse_payload(self, payload):
@@ -176,7 +176,7 @@ class ApiKeyViewSet(BaseViewSet):
 
         items = self.paginate(items)
         ser = self.get_serializer()
-        data = [ser.to_resource(o) for o in items]
+        data = ser.to_resource_many(items)
         payload = {"data": data}
         include_rels = self._parse_include(request)
         if include_rels:
@@ -401,7 +401,7 @@ class AiUsageViewSet(BaseViewSet):
         items = list(qs[offset:offset + page_size])
 
         ser = self.get_serializer()
-        data = [ser.to_resource(o) for o in items]
+        data = ser.to_resource_many(items)
         payload = {
             "data": data,
             "meta": {
@@ -541,7 +541,7 @@ class WaitlistViewSet(BaseViewSet):
         items = list(qs[offset: offset + page_size])
         ser = self.get_serializer()
         return Response({
-            "data": [ser.to_resource(o) for o in items],
+            "data": ser.to_resource_many(items),
             "meta": {"total": total, "page": page_number, "per_page": page_size, "total_pages": total_pages},
         })
 
@@ -567,7 +567,7 @@ class InvitationViewSet(BaseViewSet):
         items = list(qs[offset: offset + page_size])
         ser = self.get_serializer()
         return Response({
-            "data": [ser.to_resource(o) for o in items],
+            "data": ser.to_resource_many(items),
             "meta": {"total": total, "page": page_number, "per_page": page_size, "total_pages": total_pages},
         })
 
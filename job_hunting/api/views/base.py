@@ -14,6 +14,7 @@ from drf_spectacular.utils import (
 from job_hunting.api.permissions import IsGuestReadOnly
 from ..parsers import VndApiJSONParser
 from ..serializers import (
+    DjangoUserSerializer,
     ExperienceSerializer,
     ProjectSerializer,
     TYPE_TO_SERIALIZER,
@@ -216,9 +217,14 @@ class BaseViewSet(viewsets.ViewSet):
     def _build_included(
         self, objs, include_rels, request=None, primary_serializer=None
     ):
-        included = []
-        seen = set()  # (type, id)
+        # (type, id) -> resource; dedupes and keeps first-seen order in one
+        # structure, so the payload is just its values.
+        included = {}
         primary_ser = primary_serializer or self.get_serializer()
+        # Profiles of every user reached through `include=user`, loaded in
+        # one query per batch and shared by the user serializers below.
+        user_prefetch = {"profiles": {}}
+        prefetched_user_ids = set()
 
         def _include_recursive(
             objects,
@@ -234,6 +240,25 @@ class BaseViewSet(viewsets.ViewSet):
             segment = path_segments[0]
             remaining_segments = path_segments[1:]
 
+            # `include=user` resolves each object's owner; load them all
+            # with one query up front instead of one per object.
+            user_fk = getattr(current_serializer, "user_fk", "")
+            if user_fk and self._normalize_rel_for_serializer(
+                segment, current_serializer
+            ) == "user":
+                users = current_serializer._load_users(
+                    getattr(o, user_fk, None) for o in objects
+                )
+                new_users = [
+                    u for u in users.values()
+                    if u is not None and u.id not in prefetched_user_ids
+                ]
+                if new_users:
+                    user_prefetch["profiles"].update(
+                        DjangoUserSerializer.prefetch(new_users)["profiles"]
+                    )
+                    prefetched_user_ids.update(u.id for u in new_users)
+
             for obj in objects:
                 normalized_rel = self._normalize_rel_for_serializer(
                     segment, current_serializer
@@ -286,6 +311,10 @@ class BaseViewSet(viewsets.ViewSet):
 
                 rel_ser = ser_cls()
                 rel_ser.request = request
+                if effective_type == "user" and all(
+                    t.id in prefetched_user_ids for t in targets
+                ):
+                    rel_ser.set_prefetch(user_prefetch)
                 # Provide parent context so serializers can customize included resources
                 if hasattr(rel_ser, "set_parent_context"):
                     rel_ser.set_parent_context(
@@ -294,7 +323,7 @@ class BaseViewSet(viewsets.ViewSet):
 
                 for t in targets:
                     key = (effective_type, str(t.id))
-                    already_seen = key in seen
+                    already_seen = key in included
 
                     if not already_seen:
                         # Filter user-owned resources to only include those owned by authenticated user.
@@ -347,8 +376,7 @@ class BaseViewSet(viewsets.ViewSet):
                                 # False) which is the safe outcome.
                                 pass
 
-                        seen.add(key)
-                        included.append(rel_ser.to_resource(t))
+                        included[key] = rel_ser.to_resource(t)
 
                     # If there are more segments, always recurse (even if this node was already seen)
                     if remaining_segments:
@@ -372,7 +400,7 @@ class BaseViewSet(viewsets.ViewSet):
             path_segments = include_path.split(".")
             _include_recursive(objs, path_segments, primary_ser)
 
-        return included
+        return list(included.values())
 
     def _page_params(self):
         """Return (page_number, page_size) parsed from request, supporting both
@@ -405,15 +433,15 @@ class BaseViewSet(viewsets.ViewSet):
     def list(self, request):
         ser = self.get_serializer()
         qs = self.model.objects.all()
-        # CC-91: let the serializer pull its to-one FKs + linked to-manys in a
-        # bounded number of queries instead of a per-row N+1 in to_resource().
-        # No-op for serializers that declare no optimization hints.
-        optimize = getattr(ser, "optimize_queryset", None)
-        if optimize is not None:
-            qs = optimize(qs)
+        # CC-91: join the serializer's to-one FKs into this query; its
+        # to-many prefetches run in to_resource_many() against just the
+        # page rather than every row. No-op for serializers that declare
+        # no optimization hints.
+        if ser.list_select_related:
+            qs = qs.select_related(*ser.list_select_related)
         items = list(qs)
         items = self.paginate(items)
-        data = [ser.to_resource(o) for o in items]
+        data = ser.to_resource_many(items)
         payload = {"data": data}
         include_rels = self._parse_include(request)
         if include_rels:
@@ -306,7 +306,7 @@ class CompanyViewSet(BaseViewSet):
         questions_list = list(
             Question.objects.filter(company_id=pk)
         )
-        data = [QuestionSerializer().to_resource(q) for q in questions_list]
+        data = QuestionSerializer().to_resource_many(questions_list)
         return Response({"data": data})
 
     @extend_schema(
@@ -61,7 +61,7 @@ class CoverLetterViewSet(BaseViewSet):
         items = list(CoverLetter.objects.filter(user_id=request.user.id))
         items = self.paginate(items)
         ser = self.get_serializer()
-        data = [ser.to_resource(o) for o in items]
+        data = ser.to_resource_many(items)
         payload = {"data": data}
         include_rels = self._parse_include(request)
         if include_rels:
@@ -520,7 +520,7 @@ class JobPostViewSet(BaseViewSet):
             _attach_published_state(items, request.user)
 
         ser = self.get_serializer()
-        data = [ser.to_resource(o) for o in items]
+        data = ser.to_resource_many(items)
         payload = {
             "data": data,
             "meta": {
@@ -1824,7 +1824,7 @@ class JobPostViewSet(BaseViewSet):
 
         items = list(Question.objects.filter(application__job_post_id=pk, created_by_id=request.user.id))
         include_rels = self._parse_include(request)
-        payload = {"data": [ser.to_resource(i) for i in items]}
+        payload = {"data": ser.to_resource_many(items)}
         if include_rels:
             payload["included"] = self._build_included(items, include_rels, request, primary_serializer=ser)
         return Response(payload)
@@ -2029,7 +2029,7 @@ class JobApplicationViewSet(BaseViewSet):
         items = list(qs.all()[offset: offset + page_size])
 
         ser = self.get_serializer()
-        data = [ser.to_resource(o) for o in items]
+        data = ser.to_resource_many(items)
         payload = {
             "data": data,
             "meta": {
@@ -2254,7 +2254,7 @@ class JobApplicationViewSet(BaseViewSet):
             return Response({"errors": [{"detail": "Not found"}]}, status=404)
         ser = JobApplicationStatusSerializer()
         items = list(JobApplicationStatus.objects.filter(application_id=pk))
-        data = [ser.to_resource(i) for i in items]
+        data = ser.to_resource_many(items)
 
         # Build included only when ?include=... is provided
         include_rels = self._parse_include(request)
@@ -2278,7 +2278,7 @@ class JobApplicationViewSet(BaseViewSet):
             return Response({"errors": [{"detail": "Not found"}]}, status=404)
         ser = QuestionSerializer()
         items = list(Question.objects.filter(application_id=pk))
-        data = [ser.to_resource(i) for i in items]
+        data = ser.to_resource_many(items)
 
         # Build included only when ?include=... is provided
         include_rels = self._parse_include(request)
@@ -86,11 +86,12 @@ class QuestionViewSet(BaseViewSet):
         if "answers" in include_rels or "answer" in include_rels:
             qs = qs.prefetch_related("answers")
 
+        ser = self.get_serializer()
+        qs = qs.annotate(latest_answer_content=ser.latest_answer_content())
         items = list(qs.all()[offset: offset + page_size])
 
-        ser = self.get_serializer()
         payload = {
-            "data": [ser.to_resource(o) for o in items],
+            "data": ser.to_resource_many(items),
             "meta": {"total": total, "page": page_number, "per_page": page_size, "total_pages": total_pages},
         }
         if page_number < total_pages:
@@ -237,7 +238,7 @@ class QuestionViewSet(BaseViewSet):
 
         items = list(Answer.objects.filter(question_id=obj.id).order_by("created_at"))
         ser = AnswerSerializer()
-        data = [ser.to_resource(i) for i in items]
+        data = ser.to_resource_many(items)
 
         include_rels = self._parse_include(request)
         payload = {"data": data}
@@ -293,7 +294,7 @@ class AnswerViewSet(BaseViewSet):
 
         ser = self.get_serializer()
         payload = {
-            "data": [ser.to_resource(o) for o in items],
+            "data": ser.to_resource_many(items),
             "meta": {"total": total, "page": page_number, "per_page": page_size, "total_pages": total_pages},
         }
         if page_number < total_pages:
@@ -63,7 +63,7 @@ class ExperienceViewSet(BaseViewSet):
         items = list(self._owned_qs(request))
         items = self.paginate(items)
         ser = self.get_serializer()
-        data = [ser.to_resource(o) for o in items]
+        data = ser.to_resource_many(items)
         payload = {"data": data}
         include_rels = self._parse_include(request)
         if include_rels:
@@ -319,7 +319,7 @@ class EducationViewSet(BaseViewSet):
         items = list(self._owned_qs(request))
         items = self.paginate(items)
         ser = self.get_serializer()
-        data = [ser.to_resource(o) for o in items]
+        data = ser.to_resource_many(items)
         payload = {"data": data}
         include_rels = self._parse_include(request)
         if include_rels:
@@ -431,7 +431,7 @@ class CertificationViewSet(BaseViewSet):
         items = list(self._owned_qs(request))
         items = self.paginate(items)
         ser = self.get_serializer()
-        data = [ser.to_resource(o) for o in items]
+        data = ser.to_resource_many(items)
         payload = {"data": data}
         include_rels = self._parse_include(request)
         if include_rels:
@@ -557,7 +557,7 @@ class DescriptionViewSet(BaseViewSet):
         items = list(self._owned_qs(request))
         items = self.paginate(items)
         ser = self.get_serializer()
-        data = [ser.to_resource(o) for o in items]
+        data = ser.to_resource_many(items)
         payload = {"data": data}
         include_rels = self._parse_include(request)
         if include_rels:
@@ -795,7 +795,7 @@ class ProjectViewSet(BaseViewSet):
         items = list(self._owned_qs(request))
         items = self.paginate(items)
         ser = self.get_serializer()
-        data = [ser.to_resource(o) for o in items]
+        data = ser.to_resource_many(items)
         payload = {"data": data}
         include_rels = self._parse_include(request)
         if include_rels:
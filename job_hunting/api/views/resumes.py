@@ -1,4 +1,3 @@
-import dateparser
 import logging
 
 from django.contrib.auth import get_user_model
@@ -90,7 +89,7 @@ class ResumeViewSet(BaseViewSet):
         items = self.paginate(items)
         slim = self._is_slim_request(request)
         ser = self.get_serializer(slim=slim)
-        data = [ser.to_resource(o) for o in items]
+        data = ser.to_resource_many(items)
         payload = {"data": data}
         if not slim:
             include_rels = self._parse_include(request) or self._default_includes
@@ -175,15 +174,6 @@ class ResumeViewSet(BaseViewSet):
             except (TypeError, ValueError):
                 return None
 
-        def _dp(val):
-            if not val:
-                return None
-            try:
-                dt = dateparser.parse(str(val))
-                return dt.date() if dt else None
-            except Exception:
-                return None
-
         # Experiences: if present, PATCH to match provided set and update Experience attributes/links
         experiences_in = node.get("experiences") or data.get("experiences")
         if experiences_in is not None:
@@ -212,9 +202,9 @@ class ResumeViewSet(BaseViewSet):
                 if "summary" in exp_attrs:
                     exp.summary = exp_attrs.get("summary")
                 if "start_date" in exp_attrs:
-                    exp.start_date = _dp(exp_attrs.get("start_date"))
+                    exp.start_date = _parse_date(exp_attrs.get("start_date"))
                 if "end_date" in exp_attrs:
-                    exp.end_date = _dp(exp_attrs.get("end_date"))
+                    exp.end_date = _parse_date(exp_attrs.get("end_date"))
 
                 # Update company relation (optional)
                 exp_rels = exp_node.get("relationships") or {}
@@ -617,15 +607,6 @@ class ResumeViewSet(BaseViewSet):
             except (TypeError, ValueError):
                 return None
 
-        def _dp(val):
-            if not val:
-                return None
-            try:
-                dt = dateparser.parse(str(val))
-                return dt.date() if dt else None
-            except Exception:
-                return None
-
         # Upsert Experiences and link to resume; also upsert/link nested descriptions
         for item in experiences_in or []:
             if not isinstance(item, dict):
@@ -663,9 +644,9 @@ class ResumeViewSet(BaseViewSet):
                         if dd and getattr(dd, "content", None):
                             incoming_lines.append(dd.content.strip())
 
-            # Parse dates via dateparser
-            s_date = _dp(item.get("start_date"))
-            e_date = _dp(item.get("end_date"))
+            # Parse dates (ISO fast path, dateparser fallback)
+            s_date = _parse_date(item.get("start_date"))
+            e_date = _parse_date(item.get("end_date"))
 
             if exp is None:
                 # Try to find an existing experience with matching scalars and identical description list
@@ -275,7 +275,7 @@ class ScoreViewSet(BaseViewSet):
         items = list(qs[offset: offset + page_size])
         ser = self.get_serializer()
         return Response({
-            "data": [ser.to_resource(o) for o in items],
+            "data": ser.to_resource_many(items),
             "meta": {"total": total, "page": page_number, "per_page": page_size, "total_pages": total_pages},
         })
 
@@ -193,7 +193,7 @@ class ScrapeViewSet(BaseViewSet):
         items = list(qs.all()[offset : offset + page_size])
 
         ser = self.get_serializer()
-        data = [ser.to_resource(o) for o in items]
+        data = ser.to_resource_many(items)
         payload = {
             "data": data,
             "meta": {
@@ -1972,7 +1972,7 @@ class ScrapeProfileViewSet(BaseViewSet):
         items = list(qs[offset: offset + page_size])
         ser = self.get_serializer()
         return Response({
-            "data": [ser.to_resource(o) for o in items],
+            "data": ser.to_resource_many(items),
             "meta": {"total": total, "page": page_number, "per_page": page_size, "total_pages": total_pages},
         })
 
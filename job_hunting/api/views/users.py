@@ -40,6 +40,8 @@ from ._schema import _INCLUDE_PARAM
 
 logger = logging.getLogger(__name__)
 
+User = get_user_model()
+
 
 _USER_RESOURCE_RESPONSE = OpenApiResponse(
     description="JSON:API user resource",
@@ -142,6 +144,16 @@ class DjangoUserViewSet(viewsets.ViewSet):
         ser.request = getattr(self, "request", None)
         return ser
 
+    def _prefetched_serializer(self, users):
+        """Serializer with the users' profiles and requested `?include=`
+        relationships batch-loaded, so to_resource() and _build_included()
+        share one query per relationship instead of one per user each."""
+        ser = self.get_serializer()
+        ser.set_prefetch(
+            DjangoUserSerializer.prefetch(users, ser._requested_includes())
+        )
+        return ser
+
     def _parse_include(self, request):
         raw = []
         inc = request.query_params.get("include")
@@ -164,10 +176,10 @@ class DjangoUserViewSet(viewsets.ViewSet):
                 out.append(p)
         return out
 
-    def _build_included(self, objs, include_rels):
-        included = []
-        seen = set()  # (type, id)
-        primary_ser = self.get_serializer()
+    def _build_included(self, objs, include_rels, primary_ser=None):
+        included = {}  # (type, id) -> resource
+        if primary_ser is None:
+            primary_ser = self.get_serializer()
 
         for obj in objs:
             for rel in include_rels:
@@ -180,11 +192,9 @@ class DjangoUserViewSet(viewsets.ViewSet):
                 rel_ser = ser_cls()
                 for t in targets:
                     key = (rel_type, str(t.id))
-                    if key in seen:
-                        continue
-                    seen.add(key)
-                    included.append(rel_ser.to_resource(t))
-        return included
+                    if key not in included:
+                        included[key] = rel_ser.to_resource(t)
+        return list(included.values())
 
     @extend_schema(
         tags=["Users"],
@@ -193,8 +203,6 @@ class DjangoUserViewSet(viewsets.ViewSet):
         responses={200: _USER_LIST_RESPONSE},
     )
     def list(self, request):
-        User = get_user_model()
-
         # Restrict list to staff users or return only current user
         if request.user.is_staff:
             qs = User.objects.all()
@@ -211,12 +219,12 @@ class DjangoUserViewSet(viewsets.ViewSet):
         else:
             users = [request.user]
 
-        ser = self.get_serializer()
+        ser = self._prefetched_serializer(users)
         data = [ser.to_resource(u) for u in users]
         payload = {"data": data}
         include_rels = self._parse_include(request)
         if include_rels:
-            payload["included"] = self._build_included(users, include_rels)
+            payload["included"] = self._build_included(users, include_rels, ser)
         return Response(payload)
 
     @extend_schema(
@@ -230,7 +238,6 @@ class DjangoUserViewSet(viewsets.ViewSet):
         },
     )
     def retrieve(self, request, pk=None):
-        User = get_user_model()
         try:
             user = User.objects.get(id=int(pk))
         except (User.DoesNotExist, ValueError):
@@ -240,11 +247,11 @@ class DjangoUserViewSet(viewsets.ViewSet):
         if not request.user.is_staff and user.id != request.user.id:
             return Response({"errors": [{"detail": "Forbidden"}]}, status=403)
 
-        ser = self.get_serializer()
+        ser = self._prefetched_serializer([user])
         payload = {"data": ser.to_resource(user)}
         include_rels = self._parse_include(request)
         if include_rels:
-            payload["included"] = self._build_included([user], include_rels)
+            payload["included"] = self._build_included([user], include_rels, ser)
         return Response(payload)
 
     @extend_schema(
@@ -366,8 +373,6 @@ class DjangoUserViewSet(viewsets.ViewSet):
         except UsernamePolicyError as e:
             return Response({"errors": [{"detail": str(e)}]}, status=400)
 
-        User = get_user_model()
-
         # Check uniqueness
         if User.objects.filter(username=username).exists():
             return Response(
@@ -471,7 +476,6 @@ class DjangoUserViewSet(viewsets.ViewSet):
         return self._upsert(request, pk, partial=True)
 
     def _upsert(self, request, pk, partial=False):
-        User = get_user_model()
         try:
             user = User.objects.get(id=int(pk))
         except (User.DoesNotExist, ValueError):
@@ -582,7 +586,6 @@ class DjangoUserViewSet(viewsets.ViewSet):
     def destroy(self, request, pk=None):
         if not request.user.is_staff:
             return Response({"errors": [{"detail": "Forbidden"}]}, status=403)
-        User = get_user_model()
         try:
             user = User.objects.get(id=int(pk))
             user.delete()
@@ -627,7 +630,6 @@ class DjangoUserViewSet(viewsets.ViewSet):
     def resumes(self, request, pk=None):
         if not request.user.is_staff and int(pk) != request.user.id:
             return Response({"errors": [{"detail": "Forbidden"}]}, status=403)
-        User = get_user_model()
         try:
             user = User.objects.get(id=int(pk))
         except (User.DoesNotExist, ValueError):
@@ -648,7 +650,6 @@ class DjangoUserViewSet(viewsets.ViewSet):
     def scores(self, request, pk=None):
         if not request.user.is_staff and int(pk) != request.user.id:
             return Response({"errors": [{"detail": "Forbidden"}]}, status=403)
-        User = get_user_model()
         try:
             user = User.objects.get(id=int(pk))
         except (User.DoesNotExist, ValueError):
@@ -659,7 +660,7 @@ class DjangoUserViewSet(viewsets.ViewSet):
         scores = list(
             ScoreSerializer.optimize_queryset(Score.objects.filter(user_id=user.id))
         )
-        data = [ScoreSerializer().to_resource(s) for s in scores]
+        data = ScoreSerializer().to_resource_many(scores)
         return Response({"data": data})
 
     @extend_schema(
@@ -673,7 +674,6 @@ class DjangoUserViewSet(viewsets.ViewSet):
     def cover_letters(self, request, pk=None):
         if not request.user.is_staff and int(pk) != request.user.id:
             return Response({"errors": [{"detail": "Forbidden"}]}, status=403)
-        User = get_user_model()
         try:
             user = User.objects.get(id=int(pk))
         except (User.DoesNotExist, ValueError):
@@ -694,7 +694,6 @@ class DjangoUserViewSet(viewsets.ViewSet):
     def applications(self, request, pk=None):
         if not request.user.is_staff and int(pk) != request.user.id:
             return Response({"errors": [{"detail": "Forbidden"}]}, status=403)
-        User = get_user_model()
         try:
             user = User.objects.get(id=int(pk))
         except (User.DoesNotExist, ValueError):
@@ -707,7 +706,7 @@ class DjangoUserViewSet(viewsets.ViewSet):
                 JobApplication.objects.filter(user_id=user.id)
             )
         )
-        data = [JobApplicationSerializer().to_resource(a) for a in applications]
+        data = JobApplicationSerializer().to_resource_many(applications)
         return Response({"data": data})
 
     @extend_schema(
@@ -721,7 +720,6 @@ class DjangoUserViewSet(viewsets.ViewSet):
     def summaries(self, request, pk=None):
         if not request.user.is_staff and int(pk) != request.user.id:
             return Response({"errors": [{"detail": "Forbidden"}]}, status=403)
-        User = get_user_model()
         try:
             user = User.objects.get(id=int(pk))
         except (User.DoesNotExist, ValueError):
@@ -742,7 +740,6 @@ class DjangoUserViewSet(viewsets.ViewSet):
     @action(detail=True, methods=["get"], url_path="api-keys")
     def api_keys(self, request, pk=None):
         """Get API keys for a user"""
-        User = get_user_model()
         try:
             user = User.objects.get(id=int(pk))
         except (User.DoesNotExist, ValueError):
@@ -770,9 +767,9 @@ class DjangoUserViewSet(viewsets.ViewSet):
     )
     def me(self, request):
         user = request.user
-        ser = self.get_serializer()
+        ser = self._prefetched_serializer([user])
         payload = {"data": ser.to_resource(user)}
         include_rels = self._parse_include(request)
         if include_rels:
-            payload["included"] = self._build_included([user], include_rels)
+            payload["included"] = self._build_included([user], include_rels, ser)
         return Response(payload)
@@ -0,0 +1,28 @@
+"""Raw QUERY_STRING helpers for the request hot path.
+
+Shared by ApiKeyMiddleware and the DRF ApiKeyAuthentication class, which
+both look for an ``api_key`` query parameter on every request that
+carries a query string. Reading it straight off ``META["QUERY_STRING"]``
+keeps the auth check from forcing the full QueryDict parse behind
+``request.GET``.
+"""
+
+from urllib.parse import unquote_plus
+
+
+def query_api_key(query_string):
+    """Pull `api_key` out of a raw query string without building a QueryDict.
+
+    Mirrors `request.GET.get("api_key", "")`: the last occurrence wins and
+    percent/plus escapes are decoded (generated keys are URL-safe, so in
+    practice the value is returned as-is).
+    """
+    if "api_key=" not in query_string:
+        return ""
+    value = ""
+    for pair in query_string.split("&"):
+        if pair.startswith("api_key="):
+            value = pair[8:]
+    if "%" in value or "+" in value:
+        return unquote_plus(value)
+    return value
@@ -23,6 +23,14 @@ import os
 _SETUP_DONE_KEY = "_cc_logfire_setup_done"
 
 
+def _configure(logfire, service_name: str) -> None:
+    logfire.configure(
+        service_name=service_name,
+        scrubbing=False,
+        console=False,
+    )
+
+
 def setup_logfire(service_name: str = "career_caddy_api") -> bool:
     """Configure logfire for the Django process. Returns True if
     logfire was actually wired, False if LOGFIRE_TOKEN was unset."""
@@ -39,11 +47,7 @@ def setup_logfire(service_name: str = "career_caddy_api") -> bool:
         )
         return False
 
-    logfire.configure(
-        service_name=service_name,
-        scrubbing=False,
-        console=False,
-    )
+    _configure(logfire, service_name)
 
     from logfire.integrations.logging import LogfireLoggingHandler
 
@@ -90,3 +94,19 @@ def setup_logfire(service_name: str = "career_caddy_api") -> bool:
         "logfire configured — service=%s", service_name
     )
     return True
+
+
+def reinit_logfire_after_fork(service_name: str = "career_caddy_api") -> bool:
+    """Re-run ``logfire.configure`` in a process forked from one that already
+    ran ``setup_logfire`` (gunicorn workers under ``preload_app``). The
+    exporter / span-processor state and its background threads belong to
+    the parent and don't survive the fork, so each worker builds its own.
+    The logging handler and the instrumentation patches are plain objects
+    and code that carry over unchanged. Returns False when logfire was
+    never set up in the parent."""
+    if os.environ.get(_SETUP_DONE_KEY) != "1":
+        return False
+    import logfire
+
+    _configure(logfire, service_name)
+    return True
@@ -1,13 +1,49 @@
 import secrets
 import hashlib
 import json
+import re
+import threading
+import time
 from datetime import timedelta
+from functools import cached_property
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from .base import GetMixin
 from django.db import models
 from django.utils import timezone
 
+# Per-process cache of successful authentications, keyed by the key's
+# sha256 digest (the same value stored in ``key_hash`` — never the raw
+# token): key_hash -> (key_id, user_id, expiry_monotonic). Only plain ids
+# are cached, never model instances: gthread workers serve requests from
+# several threads, and a shared User/ApiKey would carry one request's
+# state (cached profile_obj, stale is_staff/is_active) into the next.
+# Every hit re-reads the key row and its user by primary key in one
+# query, so revocation, expiry, deactivation and deletion take effect on
+# the next request even when done in bulk (queryset .update()/.delete(),
+# cascades) where revoke()/delete() can't evict. What a hit saves is the
+# last_used_at write: that column is stamped on a miss, so it is accurate
+# to within AUTH_CACHE_TTL_SECONDS.
+AUTH_CACHE_TTL_SECONDS = 60
+AUTH_CACHE_MAX_ENTRIES = 10_000
+_auth_cache: dict[str, tuple] = {}
+_auth_cache_lock = threading.Lock()
+
+# Negative counterpart: key_hash -> expiry_monotonic for well-formed keys
+# that failed to authenticate. A flood of random `jh_` tokens then costs
+# one DB lookup per distinct token per TTL instead of one per request.
+# Kept short so a key that is (re)activated starts working promptly.
+NEG_AUTH_CACHE_TTL_SECONDS = 30
+NEG_AUTH_CACHE_MAX_ENTRIES = 50_000
+_neg_auth_cache: dict[str, float] = {}
+
+# Structural shape of a raw key: "jh_" + secrets.token_urlsafe(32) is 43
+# URL-safe characters. Anything that can't be one of ours is rejected
+# before hashing or touching the DB, so a flood of garbage tokens costs a
+# regex match each instead of a query each.
+_KEY_FORMAT_RE = re.compile(r"jh_[A-Za-z0-9_-]{20,64}")
+
 
 class ApiKey(GetMixin, models.Model):
     name = models.CharField(max_length=255, null=True, blank=True)
@@ -56,11 +92,17 @@ class ApiKey(GetMixin, models.Model):
     @classmethod
     def authenticate(cls, key: str):
         """Authenticate a raw API key. Returns instance or None."""
-        if not key or not key.startswith("jh_"):
+        if not key or not _KEY_FORMAT_RE.fullmatch(key):
             return None
 
         key_hash = hashlib.sha256(key.encode()).hexdigest()
-        obj = cls.objects.filter(key_hash=key_hash, is_active=True).first()
+        # Join the owning user into the same query so callers that need it
+        # (authenticate_with_user) don't issue a second round-trip.
+        obj = (
+            cls.objects.select_related("user")
+            .filter(key_hash=key_hash, is_active=True)
+            .first()
+        )
         if not obj:
             return None
 
@@ -71,6 +113,104 @@ class ApiKey(GetMixin, models.Model):
         obj.save(update_fields=["last_used_at"])
         return obj
 
+    @classmethod
+    def authenticate_with_user(cls, key: str):
+        """Authenticate a raw API key and resolve its user, with a short-TTL
+        in-process cache of the key's ids. Returns (instance, user),
+        (instance, None) when the owning user no longer exists, or None for
+        an invalid key or inactive user. Both objects are loaded fresh for
+        every call; keys that fail the lookup are remembered for
+        NEG_AUTH_CACHE_TTL_SECONDS and rejected without a query until then."""
+        if not key or not _KEY_FORMAT_RE.fullmatch(key):
+            return None
+
+        key_hash = hashlib.sha256(key.encode()).hexdigest()
+        if cls._recently_rejected(key_hash):
+            return None
+        return cls._authenticate_hashed(key, key_hash)
+
+    @classmethod
+    async def aauthenticate_with_user(cls, key: str):
+        """Async twin of authenticate_with_user for ASGI callers. Malformed
+        keys and cached rejections are answered inline on the event loop;
+        anything that needs the ORM hops to a thread."""
+        if not key or not _KEY_FORMAT_RE.fullmatch(key):
+            return None
+
+        key_hash = hashlib.sha256(key.encode()).hexdigest()
+        if cls._recently_rejected(key_hash):
+            return None
+        return await sync_to_async(cls._authenticate_hashed)(key, key_hash)
+
+    @classmethod
+    def _recently_rejected(cls, key_hash):
+        rejected_until = _neg_auth_cache.get(key_hash)
+        if rejected_until is None:
+            return False
+        if rejected_until > time.monotonic():
+            return True
+        with _auth_cache_lock:
+            _neg_auth_cache.pop(key_hash, None)
+        return False
+
+    @classmethod
+    def _authenticate_hashed(cls, key, key_hash):
+        cached = _auth_cache.get(key_hash)
+        if cached is not None:
+            key_id, user_id, expiry = cached
+            if expiry > time.monotonic():
+                obj = cls._load_active(key_id, user_id)
+                if obj is not None:
+                    return obj, obj.user
+            # Stale, or the key/user changed since it was cached: drop it
+            # and let the full lookup decide (and negative-cache a reject).
+            cls._evict_cached_auth(key_hash)
+        return cls._authenticate_uncached(key, key_hash)
+
+    @classmethod
+    def _load_active(cls, key_id, user_id):
+        """The key row and its user, fresh, when both are still active and
+        the key hasn't expired; else None."""
+        obj = (
+            cls.objects.select_related("user")
+            .filter(pk=key_id, user_id=user_id, is_active=True, user__is_active=True)
+            .first()
+        )
+        if obj is None or (obj.expires_at and obj.expires_at < timezone.now()):
+            return None
+        return obj
+
+    @classmethod
+    def _authenticate_uncached(cls, key, key_hash):
+        obj = cls.authenticate(key)
+        if obj is not None and obj.user is not None and not obj.user.is_active:
+            obj = None
+        if obj is None:
+            with _auth_cache_lock:
+                if len(_neg_auth_cache) >= NEG_AUTH_CACHE_MAX_ENTRIES:
+                    _neg_auth_cache.clear()
+                _neg_auth_cache[key_hash] = (
+                    time.monotonic() + NEG_AUTH_CACHE_TTL_SECONDS
+                )
+            return None
+        user = obj.user
+        if user is None:
+            cls._evict_cached_auth(key_hash)
+            return obj, None
+
+        with _auth_cache_lock:
+            if len(_auth_cache) >= AUTH_CACHE_MAX_ENTRIES:
+                _auth_cache.clear()
+            _auth_cache[key_hash] = (
+                obj.id, user.id, time.monotonic() + AUTH_CACHE_TTL_SECONDS
+            )
+        return obj, user
+
+    @staticmethod
+    def _evict_cached_auth(key_hash):
+        with _auth_cache_lock:
+            _auth_cache.pop(key_hash, None)
+
     def get_scopes(self):
         """Return scopes as a list."""
         if not self.scopes:
@@ -80,12 +220,22 @@ class ApiKey(GetMixin, models.Model):
         except (json.JSONDecodeError, TypeError):
             return []
 
+    @cached_property
+    def scope_set(self):
+        """Scopes as a frozenset, parsed once per instance."""
+        return frozenset(self.get_scopes())
+
     def has_scope(self, scope: str):
         """Check if key has a specific scope."""
-        scopes = self.get_scopes()
+        scopes = self.scope_set
         return scope in scopes or "*" in scopes
 
     def revoke(self):
         """Revoke the API key."""
         self.is_active = False
         self.save(update_fields=["is_active"])
+        self._evict_cached_auth(self.key_hash)
+
+    def delete(self, *args, **kwargs):
+        self._evict_cached_auth(self.key_hash)
+        return super().delete(*args, **kwargs)
@@ -1,5 +1,8 @@
+import atexit
 import os
+import shutil
 import sys
+import tempfile
 from datetime import timedelta
 
 import dj_database_url
@@ -84,8 +87,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "job_hunting.api.middleware.ApiKeyAuthenticationMiddleware",
-    "job_hunting.api.middleware.ApiKeyPermissionMiddleware",
+    "job_hunting.api.middleware.ApiKeyMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -166,7 +168,7 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "job_hunting.api.renderers.OrjsonJSONRenderer",
         "job_hunting.api.renderers.VndApiJSONRenderer",
     ]
     + (["rest_framework.renderers.BrowsableAPIRenderer"] if DEBUG else []),
@@ -349,6 +351,12 @@ SCRAPING_ENABLED = os.environ.get("SCRAPING_ENABLED", "False") == "True"
 CADDY_AGENT_URL = os.environ.get("CADDY_AGENT_URL", "http://localhost:3011")
 USE_CADDY_AGENT_EXTRACTION = os.environ.get("USE_CADDY_AGENT_EXTRACTION", "").lower() in ("1", "true", "yes")
 SCREENSHOT_DIR = os.environ.get("SCREENSHOT_DIR", "/app/screenshots")
+# Development guard: turn a to-one relationship that lazy-loads SQL while a
+# JSON:API serializer builds its linkage into a LazyLoadError naming the
+# serializer type and relationship, instead of a silent per-row query.
+SERIALIZER_RAISE_ON_LAZY_LOAD = os.environ.get(
+    "SERIALIZER_RAISE_ON_LAZY_LOAD", ""
+).lower() in ("1", "true", "yes")
 
 # Logging configuration
 LOGGING = {
@@ -422,6 +430,11 @@ AWS_STORAGE_BUCKET_NAME = os.environ.get("AWS_STORAGE_BUCKET_NAME", "")
 # Local media root for the FileSystemStorage fallback (self-host / dev).
 MEDIA_ROOT = os.environ.get("MEDIA_ROOT", os.path.join(BASE_DIR, "media"))
 MEDIA_URL = os.environ.get("MEDIA_URL", "/media/")
+if TESTING and "MEDIA_ROOT" not in os.environ:
+    # Uploads made by the test suite land in a throwaway dir removed at
+    # exit, not in <repo>/media.
+    MEDIA_ROOT = tempfile.mkdtemp(prefix="cc-test-media-")
+    atexit.register(shutil.rmtree, MEDIA_ROOT, ignore_errors=True)
 
 if AWS_STORAGE_BUCKET_NAME:
     # Wasabi (S3-compatible) via django-storages. Path-style addressing +
@@ -64,6 +64,79 @@ class TestApiKeyModel(TestCase):
         obj.refresh_from_db()
         self.assertFalse(obj.is_active)
 
+    def test_authenticate_with_user_caches_hit(self):
+        obj, raw_key = ApiKey.generate_key(name="test", user_id=self.user.id)
+        found, user = ApiKey.authenticate_with_user(raw_key)
+        self.assertEqual(found.id, obj.id)
+        self.assertEqual(user.id, self.user.id)
+        # A hit re-reads the key and user by pk but skips the last_used_at write.
+        with self.assertNumQueries(1):
+            found_again, user_again = ApiKey.authenticate_with_user(raw_key)
+        self.assertEqual(user_again.id, self.user.id)
+        # Fresh instances per call — nothing is shared across requests.
+        self.assertIsNot(found_again, found)
+        self.assertIsNot(user_again, user)
+
+    def test_authenticate_with_user_sees_user_changes(self):
+        _, raw_key = ApiKey.generate_key(name="test", user_id=self.user.id)
+        ApiKey.authenticate_with_user(raw_key)
+        User.objects.filter(pk=self.user.pk).update(is_staff=True)
+        _, user = ApiKey.authenticate_with_user(raw_key)
+        self.assertTrue(user.is_staff)
+
+    def test_authenticate_with_user_rejects_inactive_user(self):
+        _, raw_key = ApiKey.generate_key(name="test", user_id=self.user.id)
+        self.assertIsNotNone(ApiKey.authenticate_with_user(raw_key))
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertIsNone(ApiKey.authenticate_with_user(raw_key))
+
+    def test_authenticate_with_user_bulk_revoke(self):
+        obj, raw_key = ApiKey.generate_key(name="test", user_id=self.user.id)
+        self.assertIsNotNone(ApiKey.authenticate_with_user(raw_key))
+        ApiKey.objects.filter(pk=obj.pk).update(is_active=False)
+        self.assertIsNone(ApiKey.authenticate_with_user(raw_key))
+
+    def test_authenticate_with_user_cascade_delete(self):
+        other = User.objects.create_user(username="cascade", password="pass")
+        _, raw_key = ApiKey.generate_key(name="test", user_id=other.id)
+        self.assertIsNotNone(ApiKey.authenticate_with_user(raw_key))
+        other.delete()
+        self.assertIsNone(ApiKey.authenticate_with_user(raw_key))
+
+    def test_authenticate_with_user_cold_is_one_select(self):
+        _, raw_key = ApiKey.generate_key(name="test", user_id=self.user.id)
+        # One SELECT joining api_keys + auth_user, one UPDATE of last_used_at.
+        with self.assertNumQueries(2):
+            _, user = ApiKey.authenticate_with_user(raw_key)
+        self.assertEqual(user.id, self.user.id)
+
+    def test_authenticate_with_user_wrong_key(self):
+        self.assertIsNone(ApiKey.authenticate_with_user("jh_wrongkey"))
+
+    def test_authenticate_with_user_caches_miss(self):
+        unknown_key = "jh_" + "z" * 43
+        self.assertIsNone(ApiKey.authenticate_with_user(unknown_key))
+        with self.assertNumQueries(0):
+            self.assertIsNone(ApiKey.authenticate_with_user(unknown_key))
+
+    def test_malformed_key_rejected_without_query(self):
+        for key in ("jh_short", "jh_" + "a" * 65, "jh_bad key!" + "a" * 20, "x" * 43):
+            with self.assertNumQueries(0):
+                self.assertIsNone(ApiKey.authenticate(key))
+                self.assertIsNone(ApiKey.authenticate_with_user(key))
+
+    def test_authenticate_with_user_evicted_on_revoke(self):
+        obj, raw_key = ApiKey.generate_key(name="test", user_id=self.user.id)
+        self.assertIsNotNone(ApiKey.authenticate_with_user(raw_key))
+        obj.revoke()
+        self.assertIsNone(ApiKey.authenticate_with_user(raw_key))
+
+    def test_authenticate_with_user_evicted_on_delete(self):
+        obj, raw_key = ApiKey.generate_key(name="test", user_id=self.user.id)
+        self.assertIsNotNone(ApiKey.authenticate_with_user(raw_key))
+        obj.delete()
+        self.assertIsNone(ApiKey.authenticate_with_user(raw_key))
+
 
 class TestApiKeyAPI(TestCase):
     def setUp(self):
@@ -0,0 +1,172 @@
+"""ApiKeyMiddleware: `jh_` key authentication + scope enforcement in one pass.
+
+Driven directly with a RequestFactory and a stub `get_response` so the
+assertions cover the middleware contract alone (which user lands on the
+request, when the 403 short-circuits) independent of any view.
+"""
+
+import json
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+
+from job_hunting.api.middleware import ApiKeyMiddleware
+from job_hunting.lib.query_string import query_api_key
+from job_hunting.models import ApiKey
+
+User = get_user_model()
+
+
+class TestApiKeyMiddleware(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username="svc", password="pass")
+        self.seen = []
+
+        def get_response(request):
+            self.seen.append(request)
+            return HttpResponse("ok")
+
+        self.middleware = ApiKeyMiddleware(get_response)
+
+    def _request(self, method="get", path="/api/v1/job-posts/", **extra):
+        request = getattr(self.factory, method)(path, **extra)
+        request.user = AnonymousUser()
+        return request
+
+    def test_sync_chain_is_not_coroutine(self):
+        self.assertFalse(iscoroutinefunction(self.middleware))
+        self.assertFalse(hasattr(self.middleware, "__dict__"))
+
+    def test_bearer_key_authenticates(self):
+        _, raw_key = ApiKey.generate_key(name="svc", user_id=self.user.id, scopes=["read"])
+        response = self.middleware(self._request(HTTP_AUTHORIZATION=f"Bearer {raw_key}"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.seen[0].user.id, self.user.id)
+        self.assertEqual(self.seen[0].api_key.user_id, self.user.id)
+
+    def test_x_api_key_header_authenticates(self):
+        _, raw_key = ApiKey.generate_key(name="svc", user_id=self.user.id, scopes=["*"])
+        response = self.middleware(self._request(HTTP_X_API_KEY=raw_key))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.seen[0].user.id, self.user.id)
+
+    def test_query_param_authenticates(self):
+        _, raw_key = ApiKey.generate_key(name="svc", user_id=self.user.id, scopes=["read"])
+        response = self.middleware(self._request(path=f"/api/v1/job-posts/?api_key={raw_key}"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.seen[0].user.id, self.user.id)
+
+    def test_invalid_key_passes_through_anonymous(self):
+        response = self.middleware(self._request(HTTP_AUTHORIZATION="Bearer jh_nope"))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(self.seen[0].user.is_authenticated)
+        self.assertFalse(hasattr(self.seen[0], "api_key"))
+
+    def test_read_scope_rejects_write(self):
+        _, raw_key = ApiKey.generate_key(name="svc", user_id=self.user.id, scopes=["read"])
+        response = self.middleware(
+            self._request(method="post", HTTP_AUTHORIZATION=f"Bearer {raw_key}")
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response["Content-Type"], "application/vnd.api+json")
+        self.assertEqual(
+            json.loads(response.content),
+            {"errors": [{"detail": "Insufficient API key permissions"}]},
+        )
+        self.assertEqual(self.seen, [])
+
+    def test_wildcard_scope_allows_write(self):
+        _, raw_key = ApiKey.generate_key(name="svc", user_id=self.user.id, scopes=["*"])
+        response = self.middleware(
+            self._request(method="patch", HTTP_AUTHORIZATION=f"Bearer {raw_key}")
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_skip_paths_bypass_auth(self):
+        _, raw_key = ApiKey.generate_key(name="svc", user_id=self.user.id, scopes=["read"])
+        response = self.middleware(
+            self._request(
+                method="post",
+                path="/api/v1/healthcheck/",
+                HTTP_AUTHORIZATION=f"Bearer {raw_key}",
+            )
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(self.seen[0].user.is_authenticated)
+
+    def test_skip_prefix_matches_nested_path_only_at_start(self):
+        _, raw_key = ApiKey.generate_key(name="svc", user_id=self.user.id, scopes=["read"])
+        header = {"HTTP_AUTHORIZATION": f"Bearer {raw_key}"}
+        self.middleware(self._request(path="/static/css/app.css", **header))
+        self.middleware(self._request(path="/api/v1/static/", **header))
+        self.assertFalse(self.seen[0].user.is_authenticated)
+        self.assertEqual(self.seen[1].user.id, self.user.id)
+
+    def test_session_user_skips_key_lookup(self):
+        other = User.objects.create_user(username="browser", password="pass")
+        _, raw_key = ApiKey.generate_key(name="svc", user_id=self.user.id, scopes=["read"])
+        request = self._request(method="post", HTTP_AUTHORIZATION=f"Bearer {raw_key}")
+        request.user = other
+        with self.assertNumQueries(0):
+            response = self.middleware(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.seen[0].user.id, other.id)
+        self.assertFalse(hasattr(self.seen[0], "api_key"))
+
+    def test_query_param_without_api_key_skips_querydict(self):
+        request = self._request(path="/api/v1/job-posts/?page=2&sort=-created_at")
+        self.middleware(request)
+        self.assertNotIn("GET", request.__dict__)
+        self.assertFalse(self.seen[0].user.is_authenticated)
+
+
+class TestApiKeyMiddlewareAsync(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username="svc", password="pass")
+        self.seen = []
+
+        async def get_response(request):
+            self.seen.append(request)
+            return HttpResponse("ok")
+
+        self.middleware = ApiKeyMiddleware(get_response)
+
+    def test_async_chain_marks_middleware_coroutine(self):
+        self.assertTrue(iscoroutinefunction(self.middleware))
+
+    async def test_bearer_key_authenticates(self):
+        _, raw_key = await sync_to_async(ApiKey.generate_key)(
+            name="svc", user_id=self.user.id, scopes=["read"]
+        )
+        request = self.factory.get(
+            "/api/v1/job-posts/", HTTP_AUTHORIZATION=f"Bearer {raw_key}"
+        )
+        response = await self.middleware(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.seen[0].user.id, self.user.id)
+
+    async def test_read_scope_rejects_write(self):
+        _, raw_key = await sync_to_async(ApiKey.generate_key)(
+            name="svc", user_id=self.user.id, scopes=["read"]
+        )
+        request = self.factory.post(
+            "/api/v1/job-posts/", HTTP_AUTHORIZATION=f"Bearer {raw_key}"
+        )
+        response = await self.middleware(request)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(self.seen, [])
+
+
+class TestQueryApiKey(TestCase):
+    def test_matches_querydict_semantics(self):
+        self.assertEqual(query_api_key(""), "")
+        self.assertEqual(query_api_key("page=2"), "")
+        self.assertEqual(query_api_key("my_api_key=jh_x"), "")
+        self.assertEqual(query_api_key("api_key=jh_a&page=2"), "jh_a")
+        self.assertEqual(query_api_key("page=2&api_key=jh_a&api_key=jh_b"), "jh_b")
+        self.assertEqual(query_api_key("api_key=jh_a%2Db"), "jh_a-b")
@@ -17,16 +17,24 @@ import uuid
 
 from django.contrib.auth import get_user_model
 from django.db import connection
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 
+from job_hunting.api.serializers import (
+    CoverLetterSerializer,
+    JobApplicationSerializer,
+    LazyLoadError,
+    ScoreSerializer,
+)
+from job_hunting.api.views.cover_letters import CoverLetterViewSet
 from job_hunting.models import (
     Company,
     CoverLetter,
     JobApplication,
     JobApplicationStatus,
     JobPost,
+    Profile,
     Resume,
     Score,
     Status,
@@ -173,6 +181,114 @@ class TestUserRelatedLinkN1(_QueryCountMixin, TestCase):
         self.assertEqual(len(r_big.json().get("included", [])), 6)
 
 
+class TestUserListN1(_QueryCountMixin, TestCase):
+    """Staff `GET /users/?include=scores` used to run a Profile query per user
+    plus a scores query per user in to_resource() and again in
+    _build_included(). DjangoUserSerializer.prefetch() batches both."""
+
+    def _add_users(self, n):
+        for _ in range(n):
+            u = User.objects.create_user(
+                username=f"cc91u{uuid.uuid4().hex[:10]}", password="x"
+            )
+            Profile.objects.create(user=u, phone="555")
+            _make_score(u)
+
+    def test_staff_user_list_with_include_bounded(self):
+        staff = User.objects.create_user(
+            username="cc91_staff", password="x", is_staff=True
+        )
+        client = APIClient()
+        client.force_authenticate(user=staff)
+        url = "/api/v1/users/?include=scores"
+        self._add_users(2)
+        q_small, _ = self._get_counting(client, url)
+        self._add_users(4)
+        q_big, r_big = self._get_counting(client, url)
+        self.assertEqual(q_small, q_big)
+        self.assertEqual(len(r_big.json()["data"]), 7)
+        self.assertEqual(len(r_big.json()["included"]), 6)
+        with_phone = [
+            d for d in r_big.json()["data"] if d["attributes"]["phone"] == "555"
+        ]
+        self.assertEqual(len(with_phone), 6)
+        for d in with_phone:
+            self.assertEqual(len(d["relationships"]["scores"]["data"]), 1)
+
+
+class TestIncludeUserN1(_QueryCountMixin, TestCase):
+    def test_cover_letter_include_user_bounded(self):
+        # `include=user` used to run User.objects.get() once per row; the
+        # owners are now bulk-loaded in one in_bulk() query.
+        small = User.objects.create_user(username="cc91_cl_small", password="x")
+        for _ in range(2):
+            CoverLetter.objects.create(user=small)
+        big = User.objects.create_user(username="cc91_cl_big", password="x")
+        for _ in range(6):
+            CoverLetter.objects.create(user=big)
+        _, r_big = self._assert_bounded(
+            lambda _u: "/api/v1/cover-letters/?include=user", small, big
+        )
+        included = r_big.json()["included"]
+        self.assertEqual([(i["type"], i["id"]) for i in included], [("user", str(big.id))])
+
+    def test_include_user_profiles_batched_across_owners(self):
+        # Each included user used to look up its Profile separately; the
+        # owners' profiles are now prefetched alongside the users.
+        def count(n):
+            letters = []
+            for _ in range(n):
+                owner = User.objects.create_user(
+                    username=f"cc91_owner_{uuid.uuid4().hex[:10]}", password="x"
+                )
+                Profile.objects.get_or_create(user=owner, defaults={"phone": "555"})
+                letters.append(CoverLetter.objects.create(user=owner))
+            view = CoverLetterViewSet()
+            with CaptureQueriesContext(connection) as ctx:
+                included = view._build_included(
+                    letters, ["user"], primary_serializer=CoverLetterSerializer()
+                )
+            self.assertEqual(len(included), n)
+            self.assertTrue(all(i["attributes"]["phone"] == "555" for i in included))
+            return len(ctx)
+
+        self.assertEqual(count(2), count(5))
+
+
+class TestToResourceManyN1(TestCase):
+    """to_resource_many() batch-loads the list hints onto rows fetched
+    without them (e.g. one page of a plain queryset)."""
+
+    def _count(self, user):
+        apps = list(JobApplication.objects.filter(user=user))
+        with CaptureQueriesContext(connection) as ctx:
+            data = JobApplicationSerializer().to_resource_many(apps)
+        return len(ctx), data
+
+    def test_query_count_independent_of_row_count(self):
+        small = User.objects.create_user(username="cc91_many_small", password="x")
+        for _ in range(2):
+            _make_application(small)
+        big = User.objects.create_user(username="cc91_many_big", password="x")
+        for _ in range(6):
+            _make_application(big)
+        q_small, data_small = self._count(small)
+        q_big, data_big = self._count(big)
+        self.assertEqual(q_small, q_big)
+        self.assertEqual(len(data_small), 2)
+        self.assertEqual(len(data_big), 6)
+        self.assertTrue(data_big[0]["relationships"]["application-statuses"]["data"])
+
+    def test_matches_per_row_to_resource(self):
+        user = User.objects.create_user(username="cc91_many_same", password="x")
+        app = _make_application(user)
+        ser = JobApplicationSerializer()
+        self.assertEqual(
+            ser.to_resource_many([JobApplication.objects.get(id=app.id)]),
+            [ser.to_resource(JobApplication.objects.get(id=app.id))],
+        )
+
+
 class TestToResourceLinkagePreserved(TestCase):
     """Guard the to_resource FK-id preference: emitted to-one linkage ids must
     still equal the FK column values, and the linked to-many linkage stays."""
@@ -205,3 +321,37 @@ class TestToResourceLinkagePreserved(TestCase):
         rels = row["relationships"]
         self.assertEqual(rels["job-post"]["data"]["id"], str(score.job_post_id))
         self.assertEqual(rels["company"]["data"]["id"], str(score.job_post.company_id))
+
+
+@override_settings(SERIALIZER_RAISE_ON_LAZY_LOAD=True)
+class TestLazyLoadGuard(TestCase):
+    """With the development guard on, a to-one linkage that has to lazy-load
+    its target is a hard error naming the serializer type and relationship."""
+
+    def setUp(self):
+        user = User.objects.create_user(username="cc91_guard", password="x")
+        self.score_id = _make_score(user).id
+
+    def test_unloaded_property_relationship_raises(self):
+        score = Score.objects.get(id=self.score_id)
+        with self.assertRaisesRegex(LazyLoadError, r"^score\.company "):
+            ScoreSerializer().to_resource(score)
+
+    def test_reflective_path_raises_too(self):
+        score = Score.objects.get(id=self.score_id)
+        ser = ScoreSerializer()
+        ser._dump_fn = None
+        with self.assertRaisesRegex(LazyLoadError, r"^score\.company "):
+            ser.to_resource(score)
+
+    def test_select_related_rows_pass(self):
+        score = Score.objects.select_related("job_post__company").get(id=self.score_id)
+        res = ScoreSerializer().to_resource(score)
+        self.assertEqual(
+            res["relationships"]["company"]["data"]["id"],
+            str(score.job_post.company_id),
+        )
+
+    def test_to_resource_many_passes(self):
+        scores = list(Score.objects.filter(id=self.score_id))
+        self.assertEqual(len(ScoreSerializer().to_resource_many(scores)), 1)
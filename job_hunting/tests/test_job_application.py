@@ -2,6 +2,7 @@ from django.test import TestCase
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
+from job_hunting.api.serializers import JobApplicationSerializer
 from job_hunting.models import Company, JobPost, JobApplication
 
 User = get_user_model()
@@ -95,3 +96,36 @@ class TestJobApplicationAPI(TestCase):
         other_client.force_authenticate(user=other)
         response = other_client.get(f"/api/v1/job-applications/{self.application.id}/")
         self.assertIn(response.status_code, [403, 404])
+
+
+class TestJobApplicationPayloadAliases(TestCase):
+    def test_legacy_relationship_names_map_to_fk_columns(self):
+        out = JobApplicationSerializer().parse_payload(
+            {
+                "data": {
+                    "type": "job-application",
+                    "attributes": {"status": "applied"},
+                    "relationships": {
+                        "job_post": {"data": {"type": "job-post", "id": "jp1"}},
+                        "companies": {"data": None},
+                    },
+                }
+            }
+        )
+        self.assertEqual(
+            out, {"status": "applied", "job_post_id": "jp1", "company_id": None}
+        )
+
+    def test_aliases_are_not_declared_relationships(self):
+        ser = JobApplicationSerializer
+        self.assertLessEqual(set(ser.relationship_fks), set(ser.relationships))
+
+    def test_accepted_types_frozen_per_class(self):
+        self.assertEqual(
+            JobApplicationSerializer().accepted_types(),
+            {"application", "applications", "job-application", "job-applications"},
+        )
+        self.assertIs(
+            JobApplicationSerializer().accepted_types(),
+            JobApplicationSerializer._accepted_types,
+        )
@@ -0,0 +1,28 @@
+"""reinit_logfire_after_fork: gunicorn's post_fork hook re-configures logfire
+in each preloaded worker, and only when the master actually set it up."""
+
+import os
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from job_hunting import logfire_setup
+
+
+class TestReinitLogfireAfterFork(SimpleTestCase):
+    def test_noop_when_parent_never_set_up(self):
+        with mock.patch.dict(os.environ, clear=False) as env, mock.patch(
+            "logfire.configure"
+        ) as configure:
+            env.pop(logfire_setup._SETUP_DONE_KEY, None)
+            self.assertFalse(logfire_setup.reinit_logfire_after_fork())
+        configure.assert_not_called()
+
+    def test_reconfigures_when_parent_set_up(self):
+        with mock.patch.dict(
+            os.environ, {logfire_setup._SETUP_DONE_KEY: "1"}
+        ), mock.patch("logfire.configure") as configure:
+            self.assertTrue(logfire_setup.reinit_logfire_after_fork())
+        configure.assert_called_once_with(
+            service_name="career_caddy_api", scrubbing=False, console=False
+        )
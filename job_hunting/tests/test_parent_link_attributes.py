@@ -0,0 +1,159 @@
+"""Per-link attributes injected when a child renders under its parent
+(description 'order' under an experience, skill 'active' and experience
+'order' under a resume) come from one join-table query per parent, not one lookup per child."""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from job_hunting.api.serializers import (
+    DescriptionSerializer,
+    ExperienceSerializer,
+    SkillSerializer,
+)
+from job_hunting.models import (
+    Description,
+    Experience,
+    ExperienceDescription,
+    Resume,
+    ResumeExperience,
+    ResumeSkill,
+    Skill,
+)
+
+
+def _link_queries(ctx, link_model):
+    table = f'"{link_model._meta.db_table}"'
+    return [q["sql"] for q in ctx.captured_queries if table in q["sql"]]
+
+
+class TestDescriptionOrderUnderExperience(TestCase):
+    def test_order_loaded_with_one_query(self):
+        experience = Experience.objects.create(title="Eng")
+        descriptions = [Description.objects.create(content=f"d{i}") for i in range(3)]
+        for order, desc in zip((2, 0), descriptions[:2]):
+            ExperienceDescription.objects.create(
+                experience=experience, description=desc, order=order
+            )
+        ser = DescriptionSerializer()
+        ser.set_parent_context("experience", experience.id, "descriptions")
+        with CaptureQueriesContext(connection) as ctx:
+            attrs = [ser.to_resource(d)["attributes"] for d in descriptions]
+        self.assertEqual(len(ctx), 1)
+        self.assertEqual(attrs[0]["order"], 2)
+        self.assertEqual(attrs[1]["order"], 0)
+        self.assertNotIn("order", attrs[2])
+
+    def test_without_parent_context_no_query(self):
+        desc = Description.objects.create(content="solo")
+        with CaptureQueriesContext(connection) as ctx:
+            res = DescriptionSerializer().to_resource(desc)
+        self.assertEqual(len(ctx), 0)
+        self.assertNotIn("order", res["attributes"])
+
+
+class TestSkillActiveUnderResume(TestCase):
+    def test_active_loaded_with_one_query(self):
+        resume = Resume.objects.create()
+        skills = [Skill.objects.create(text=f"s{i}") for i in range(3)]
+        ResumeSkill.objects.create(resume=resume, skill=skills[0], active=True)
+        ResumeSkill.objects.create(resume=resume, skill=skills[1], active=False)
+        ser = SkillSerializer()
+        ser.set_parent_context("resume", resume.id, "skills")
+        with CaptureQueriesContext(connection) as ctx:
+            attrs = [ser.to_resource(s)["attributes"] for s in skills]
+        self.assertEqual(len(ctx), 1)
+        self.assertIs(attrs[0]["active"], True)
+        self.assertIs(attrs[1]["active"], False)
+        self.assertNotIn("active", attrs[2])
+
+
+class TestExperienceOrderUnderResume(TestCase):
+    def test_order_loaded_with_one_query(self):
+        resume = Resume.objects.create()
+        experiences = [Experience.objects.create(title=f"e{i}") for i in range(3)]
+        ResumeExperience.objects.create(resume=resume, experience=experiences[0], order=1)
+        ResumeExperience.objects.create(resume=resume, experience=experiences[1], order=0)
+        ser = ExperienceSerializer()
+        ser.set_parent_context("resume", resume.id, "experiences")
+        with CaptureQueriesContext(connection) as ctx:
+            attrs = [ser.to_resource(e)["attributes"] for e in experiences]
+        # The descriptions linkage still queries per row; only the join
+        # table lookup is batched.
+        self.assertEqual(len(_link_queries(ctx, ResumeExperience)), 1)
+        self.assertEqual([a["resume_id"] for a in attrs], [resume.id] * 3)
+        self.assertEqual(attrs[0]["order"], 1)
+        self.assertEqual(attrs[1]["order"], 0)
+        self.assertNotIn("order", attrs[2])
+
+    def test_without_parent_context_no_resume_attributes(self):
+        experience = Experience.objects.create(title="solo")
+        with CaptureQueriesContext(connection) as ctx:
+            attrs = ExperienceSerializer().to_resource(experience)["attributes"]
+        self.assertEqual(_link_queries(ctx, ResumeExperience), [])
+        self.assertNotIn("resume_id", attrs)
+        self.assertNotIn("order", attrs)
+
+
+class TestExperienceEndpointShape(TestCase):
+    """resume_id / order are per-link values and are only emitted when an
+    experience is listed under a resume. The standalone /experiences/
+    endpoints never carried them: the old `obj.resumes[0]` fallback read an
+    attribute Experience doesn't have."""
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(
+            username="exp_shape", password="x", is_staff=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=user)
+        self.resume = Resume.objects.create(user=user)
+        self.experience = Experience.objects.create(title="linked")
+        ResumeExperience.objects.create(
+            resume=self.resume, experience=self.experience, order=2
+        )
+
+    def test_standalone_list_and_detail_omit_resume_attributes(self):
+        listed = self.client.get("/api/v1/experiences/").json()["data"]
+        detail = self.client.get(
+            f"/api/v1/experiences/{self.experience.id}/"
+        ).json()["data"]
+        row = next(r for r in listed if r["id"] == str(self.experience.id))
+        for attrs in (row["attributes"], detail["attributes"]):
+            self.assertNotIn("resume_id", attrs)
+            self.assertNotIn("order", attrs)
+
+    def test_under_resume_includes_resume_attributes(self):
+        data = self.client.get(
+            f"/api/v1/resumes/{self.resume.id}/experiences/"
+        ).json()["data"]
+        self.assertEqual(data[0]["attributes"]["resume_id"], self.resume.id)
+        self.assertEqual(data[0]["attributes"]["order"], 2)
+
+
+class TestExperienceDescriptionsLinkage(TestCase):
+    def test_to_resource_many_loads_descriptions_once(self):
+        experiences = [Experience.objects.create(title=f"e{i}") for i in range(3)]
+        first, second = (
+            [Description.objects.create(content=f"{e.title}-{i}") for i in range(2)]
+            for e in experiences[:2]
+        )
+        for exp, descs in ((experiences[0], first), (experiences[1], second)):
+            # Insert in reverse so linkage order comes from `order`, not pk.
+            for order, desc in reversed(list(enumerate(descs))):
+                ExperienceDescription.objects.create(
+                    experience=exp, description=desc, order=order
+                )
+        ser = ExperienceSerializer()
+        expected = [ser.to_resource(e) for e in experiences]
+        with CaptureQueriesContext(connection) as ctx:
+            data = ExperienceSerializer().to_resource_many(experiences)
+        self.assertEqual(len(_link_queries(ctx, ExperienceDescription)), 1)
+        self.assertEqual(data, expected)
+        self.assertEqual(
+            [d["id"] for d in data[0]["relationships"]["descriptions"]["data"]],
+            [str(d.id) for d in first],
+        )
+        self.assertEqual(data[2]["relationships"]["descriptions"]["data"], [])
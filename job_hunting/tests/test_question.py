@@ -1,8 +1,13 @@
+from datetime import timedelta
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
-from job_hunting.models import Question, Company, JobApplication
+from job_hunting.api.serializers import QuestionSerializer
+from job_hunting.models import Answer, Question, Company, JobApplication
 
 User = get_user_model()
 
@@ -77,3 +82,50 @@ class TestQuestionAPI(TestCase):
         response = self.client.delete(f"/api/v1/questions/{q.id}/")
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(Question.objects.filter(pk=q.id).exists())
+
+
+class TestQuestionLatestAnswer(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="qlatest", password="pass")
+        self.questions = [
+            Question.objects.create(content=f"q{i}", created_by=self.user)
+            for i in range(3)
+        ]
+        for i, q in enumerate(self.questions[:2]):
+            old = Answer.objects.create(question=q, content=f"old{i}")
+            new = Answer.objects.create(question=q, content=f"new{i}")
+            # Bump one answer's timestamp past the other so "latest" is
+            # decided by created_at, not by insertion order.
+            Answer.objects.filter(pk=new.pk).update(
+                created_at=old.created_at + timedelta(seconds=1)
+            )
+
+    def test_to_resource_many_loads_latest_answers_in_one_query(self):
+        ser = QuestionSerializer()
+        with CaptureQueriesContext(connection) as ctx:
+            attrs = [r["attributes"] for r in ser.to_resource_many(self.questions)]
+        answer_queries = [q for q in ctx.captured_queries if '"answer"' in q["sql"]]
+        self.assertEqual(len(answer_queries), 1)
+        self.assertEqual(attrs[0]["answer"], "new0")
+        self.assertEqual(attrs[1]["answer"], "new1")
+        self.assertNotIn("answer", attrs[2])
+
+    def test_to_resource_single_matches(self):
+        res = QuestionSerializer().to_resource(self.questions[1])
+        self.assertEqual(res["attributes"]["answer"], "new1")
+
+    def test_list_endpoint_selects_latest_answer_with_the_page(self):
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            resp = client.get("/api/v1/questions/")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        by_content = {
+            r["attributes"]["content"]: r["attributes"].get("answer")
+            for r in resp.json()["data"]
+        }
+        self.assertEqual(by_content, {"q0": "new0", "q1": "new1", "q2": None})
+        # The page query carries the subquery; no separate answer lookup.
+        answer_queries = [q for q in ctx.captured_queries if '"answer"' in q["sql"]]
+        self.assertEqual(len(answer_queries), 1)
+        self.assertIn('FROM "question"', answer_queries[0]["sql"])
@@ -0,0 +1,78 @@
+"""VndApiJSONRenderer: orjson output must match DRF's compact JSONRenderer."""
+
+import datetime
+import decimal
+import uuid
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from job_hunting.api.renderers import OrjsonJSONRenderer, VndApiJSONRenderer
+
+
+class TestVndApiJSONRenderer(SimpleTestCase):
+    def setUp(self):
+        self.renderer = VndApiJSONRenderer()
+
+    def test_matches_drf_json_renderer(self):
+        data = {
+            "data": [
+                {
+                    "type": "job-post",
+                    "id": "abc123",
+                    "attributes": {
+                        "title": "Ingénieur — backend",
+                        "created-at": datetime.datetime(
+                            2026, 5, 1, 12, 30, 45, 123456, tzinfo=datetime.UTC
+                        ),
+                        "posted-date": datetime.date(2026, 5, 1),
+                        "salary": decimal.Decimal("123.45"),
+                        "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+                        "label": gettext_lazy("Applied"),
+                        "score": None,
+                    },
+                }
+            ],
+            "meta": {"total": 1},
+        }
+        self.assertEqual(self.renderer.render(data), JSONRenderer().render(data))
+
+    def test_none_renders_empty(self):
+        self.assertEqual(self.renderer.render(None), b"")
+
+    def test_always_compact(self):
+        rendered = self.renderer.render(
+            {"data": []}, "application/vnd.api+json; indent=2"
+        )
+        self.assertEqual(rendered, b'{"data":[]}')
+
+
+class TestOrjsonJSONRenderer(SimpleTestCase):
+    def setUp(self):
+        self.renderer = OrjsonJSONRenderer()
+        self.data = {
+            "id": "abc123",
+            "created-at": datetime.datetime(2026, 5, 1, 12, 30, 45, 123456),
+            "salary": decimal.Decimal("1.50"),
+            "label": gettext_lazy("Applied"),
+            "tags": ["a", "é"],
+        }
+
+    def test_compact_matches_drf(self):
+        self.assertEqual(
+            self.renderer.render(self.data, "application/json"),
+            JSONRenderer().render(self.data, "application/json"),
+        )
+
+    def test_indent_defers_to_drf(self):
+        media_type = "application/json; indent=2"
+        self.assertEqual(
+            self.renderer.render(self.data, media_type),
+            JSONRenderer().render(self.data, media_type),
+        )
+        context = {"indent": 4}
+        self.assertEqual(
+            self.renderer.render(self.data, "application/json", context),
+            JSONRenderer().render(self.data, "application/json", context),
+        )
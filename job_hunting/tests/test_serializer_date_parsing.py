@@ -0,0 +1,106 @@
+"""_parse_date / _parse_datetime: ISO 8601 is parsed without dateparser, and
+free-form input still falls back to it with the same results."""
+
+from datetime import date, datetime
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from job_hunting.api.serializers import (
+    _dateparser_absolute,
+    _parse_date,
+    _parse_datetime,
+)
+
+
+class TestParseDate(SimpleTestCase):
+    def test_iso_inputs_skip_dateparser(self):
+        with mock.patch("dateparser.parse") as parse:
+            self.assertEqual(_parse_date("2024-03-05"), date(2024, 3, 5))
+            self.assertEqual(_parse_date("2024-03-05T23:30:00-05:00"), date(2024, 3, 5))
+            self.assertEqual(_parse_date("2024-03-05T10:00:00Z"), date(2024, 3, 5))
+        parse.assert_not_called()
+
+    def test_free_form_falls_back_to_dateparser(self):
+        self.assertEqual(_parse_date("March 5, 2024"), date(2024, 3, 5))
+
+    def test_empty_and_garbage(self):
+        self.assertIsNone(_parse_date(None))
+        self.assertIsNone(_parse_date(""))
+        self.assertIsNone(_parse_date("not a date at all"))
+
+    def test_out_of_range_iso_date_is_none_without_dateparser(self):
+        with mock.patch("dateparser.parse") as parse:
+            self.assertIsNone(_parse_date("2024-13-45"))
+            self.assertIsNone(_parse_datetime("2024-02-30"))
+        parse.assert_not_called()
+
+    def test_iso_prefix_with_zone_name_or_meridiem_falls_back(self):
+        # Starts like an ISO timestamp but fromisoformat rejects it; must
+        # still reach dateparser rather than come back as None.
+        for s in (
+            "2024-01-15 10:30:00 UTC",
+            "2024-01-15 10:30 AM",
+            "2024-01-15T10:30:00 PST",
+            "2024-01-15 10:30:00 GMT",
+        ):
+            with self.subTest(s=s):
+                self.assertEqual(_parse_date(s), date(2024, 1, 15))
+
+
+class TestParseDatetime(SimpleTestCase):
+    def test_iso_inputs_skip_dateparser(self):
+        with mock.patch("dateparser.parse") as parse:
+            self.assertEqual(
+                _parse_datetime("2024-03-05T10:15:00Z"), datetime(2024, 3, 5, 10, 15)
+            )
+            self.assertEqual(
+                _parse_datetime("2024-03-05T10:15:00+02:00"), datetime(2024, 3, 5, 8, 15)
+            )
+            self.assertEqual(
+                _parse_datetime("2024-03-05 10:15:00"), datetime(2024, 3, 5, 10, 15)
+            )
+        parse.assert_not_called()
+
+    def test_free_form_falls_back_to_dateparser(self):
+        self.assertEqual(
+            _parse_datetime("March 5, 2024 10:15"), datetime(2024, 3, 5, 10, 15)
+        )
+
+    def test_iso_prefix_with_zone_name_or_meridiem_falls_back(self):
+        self.assertEqual(
+            _parse_datetime("2024-01-15 10:30:00 UTC"), datetime(2024, 1, 15, 10, 30)
+        )
+        self.assertEqual(
+            _parse_datetime("2024-01-15 10:30:00 GMT"), datetime(2024, 1, 15, 10, 30)
+        )
+        self.assertEqual(
+            _parse_datetime("2024-01-15 10:30 AM"), datetime(2024, 1, 15, 10, 30)
+        )
+        self.assertEqual(
+            _parse_datetime("2024-01-15T10:30:00 PST"), datetime(2024, 1, 15, 18, 30)
+        )
+
+    def test_empty_and_garbage(self):
+        self.assertIsNone(_parse_datetime(None))
+        self.assertIsNone(_parse_datetime(""))
+        self.assertIsNone(_parse_datetime("not a date at all"))
+
+
+class TestDateparserCache(SimpleTestCase):
+    def setUp(self):
+        _dateparser_absolute.cache_clear()
+
+    def test_absolute_input_is_parsed_once(self):
+        self.assertEqual(_parse_date("March 5, 2024"), date(2024, 3, 5))
+        with mock.patch("dateparser.parse") as parse:
+            self.assertEqual(_parse_date("March 5, 2024"), date(2024, 3, 5))
+        parse.assert_not_called()
+
+    def test_relative_input_tracks_the_clock(self):
+        first = _parse_datetime("now")
+        later = datetime(2030, 1, 1)
+        with mock.patch("dateparser.parse", return_value=later) as parse:
+            self.assertEqual(_parse_datetime("now"), later)
+        parse.assert_called_once_with("now")
+        self.assertNotEqual(first, later)
@@ -0,0 +1,250 @@
+"""Generated per-class `_dump_fn` must emit exactly what the reflective
+BaseSerializer._build_resource does, so list responses are unchanged by the
+fast path."""
+
+import datetime
+import decimal
+import uuid
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from job_hunting.api.serializers import (
+    TYPE_TO_SERIALIZER,
+    BaseSerializer,
+    CompanySerializer,
+    CoverLetterSerializer,
+    JobApplicationSerializer,
+    JobPostDiscoverySerializer,
+    JobPostSerializer,
+    ScoreSerializer,
+    _attributes_builder,
+    _to_primitive,
+)
+from job_hunting.models import (
+    Company,
+    CoverLetter,
+    JobApplication,
+    JobPost,
+    JobPostDiscovery,
+    Resume,
+    Score,
+)
+
+User = get_user_model()
+
+
+class TestSerializerDump(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="dump", password="pass")
+        tag = uuid.uuid4().hex[:10]
+        self.company = Company.objects.create(name=f"DumpCo{tag}")
+        self.job_post = JobPost.objects.create(
+            title=f"DumpRole{tag}", company=self.company, created_by=self.user
+        )
+        self.resume = Resume.objects.create(user=self.user)
+        self.application = JobApplication.objects.create(
+            user=self.user,
+            job_post=self.job_post,
+            company=self.company,
+            resume=self.resume,
+            status="applied",
+        )
+        self.score = Score.objects.create(
+            user=self.user, job_post=self.job_post, resume=self.resume, score=80
+        )
+
+    def assertDumpMatches(self, ser_cls, obj):
+        ser = ser_cls()
+        self.assertIsNotNone(ser._dump_fn)
+        reflective = ser_cls()
+        reflective._dump_fn = None
+        self.assertEqual(ser.to_resource(obj), reflective.to_resource(obj))
+
+    def test_every_registered_serializer_is_compiled(self):
+        for ser_cls in TYPE_TO_SERIALIZER.values():
+            if issubclass(ser_cls, BaseSerializer):
+                self.assertIsNotNone(ser_cls._dump_fn, ser_cls.__name__)
+        self.assertIsNone(BaseSerializer._dump_fn)
+
+    def test_dump_matches_reflective_build(self):
+        self.assertDumpMatches(JobPostSerializer, self.job_post)
+        self.assertDumpMatches(CompanySerializer, self.company)
+        self.assertDumpMatches(JobApplicationSerializer, self.application)
+        self.assertDumpMatches(ScoreSerializer, self.score)
+        discovery = JobPostDiscovery.objects.create(job_post=self.job_post, user=self.user)
+        self.assertDumpMatches(JobPostDiscoverySerializer, discovery)
+
+    def test_null_fk_emits_null_linkage(self):
+        self.application.resume = None
+        self.application.save()
+        res = JobApplicationSerializer()._dump_fn(self.application)
+        self.assertEqual(
+            res["relationships"]["resume"],
+            {
+                "data": None,
+                "links": {
+                    "self": f"/api/v1/job-applications/{self.application.id}/relationships/resume"
+                },
+            },
+        )
+        self.assertDumpMatches(JobApplicationSerializer, self.application)
+
+    def test_date_column_holding_string_falls_back(self):
+        # Date columns are compiled to a direct isoformat() call; a row whose
+        # value was assigned as a string (not yet round-tripped through the
+        # DB) must still render it as-is via the reflective path.
+        self.job_post.posted_date = "2026-05-01"
+        self.job_post.created_at = None
+        res = JobPostSerializer().to_resource(self.job_post)
+        self.assertEqual(res["attributes"]["posted_date"], "2026-05-01")
+        self.assertIsNone(res["attributes"]["created_at"])
+        self.assertDumpMatches(JobPostSerializer, self.job_post)
+
+    def test_cover_letter_company_linkage(self):
+        letter = CoverLetter.objects.create(user=self.user, job_post=self.job_post)
+        rel = CoverLetterSerializer().to_resource(letter)["relationships"]["company"]
+        self.assertEqual(
+            rel,
+            {
+                "data": {"type": "company", "id": str(self.company.id)},
+                "links": {
+                    "self": f"/api/v1/cover-letters/{letter.id}/relationships/company",
+                    "related": f"/api/v1/companies/{self.company.id}",
+                },
+            },
+        )
+        bare = CoverLetter.objects.create(user=self.user)
+        rel = CoverLetterSerializer().to_resource(bare)["relationships"]["company"]
+        self.assertEqual(
+            rel,
+            {
+                "data": None,
+                "links": {"self": f"/api/v1/cover-letters/{bare.id}/relationships/company"},
+            },
+        )
+
+    def test_undeclared_forward_fk_linkage_reads_column(self):
+        # duplicate-of has no relationship_fks entry; its FK column is found
+        # from the model so the duplicate's row is never loaded.
+        dup = JobPost.objects.create(
+            title=f"{self.job_post.title} dup",
+            company=self.company,
+            created_by=self.user,
+            duplicate_of=self.job_post,
+        )
+        dup = JobPost.objects.get(pk=dup.pk)
+        with CaptureQueriesContext(connection) as ctx:
+            rels = JobPostSerializer()._dump_fn(dup)["relationships"]
+        # (top_score is a property that queries scores; only job_post loads matter.)
+        self.assertFalse(
+            [q for q in ctx.captured_queries if 'FROM "job_post"' in q["sql"]]
+        )
+        self.assertEqual(
+            rels["duplicate-of"]["data"], {"type": "job-post", "id": str(self.job_post.id)}
+        )
+        self.assertIsNone(rels["reposted-from"]["data"])
+        self.assertDumpMatches(JobPostSerializer, dup)
+
+    def test_missing_attribute_falls_back_to_reflective_path(self):
+        class Partial:
+            id = "abc"
+            name = "Acme"
+
+        class PartialSerializer(BaseSerializer):
+            type = "partial"
+            attributes = ["name"]
+            relationships = {"owner": {"attr": "owner", "type": "user", "uselist": False}}
+            relationship_fks = {"owner": "owner_id"}
+
+        res = PartialSerializer().to_resource(Partial())
+        self.assertEqual(res["attributes"], {"name": "Acme"})
+        self.assertEqual(res["relationships"]["owner"]["data"], None)
+
+    def test_user_fk_linkage_is_compiled_in(self):
+        self.assertFalse(ScoreSerializer._inject_user_rel)
+        self.assertTrue(JobPostDiscoverySerializer._inject_user_rel)
+        res = ScoreSerializer._dump_fn(self.score)
+        self.assertEqual(
+            res["relationships"]["user"],
+            {
+                "data": {"type": "user", "id": str(self.user.id)},
+                "links": {
+                    "self": f"/api/v1/scores/{self.score.id}/relationships/user",
+                    "related": f"/api/v1/users/{self.user.id}",
+                },
+            },
+        )
+        self.assertNotIn("user", CompanySerializer._dump_fn(self.company)["relationships"])
+
+    def test_included_linked_relationship_fetched_once(self):
+        ser = JobPostSerializer()
+        request = Request(APIRequestFactory().get("/", {"include": "scores"}))
+        request.user = self.user
+        ser.request = request
+        with mock.patch.object(
+            JobPostSerializer, "get_related", autospec=True,
+            side_effect=JobPostSerializer.get_related,
+        ) as get_related:
+            res = ser.to_resource(self.job_post)
+        score_calls = [c for c in get_related.call_args_list if c.args[2] == "scores"]
+        self.assertEqual(len(score_calls), 1)
+        self.assertEqual(
+            res["relationships"]["scores"]["data"],
+            [{"type": "score", "id": str(self.score.id)}],
+        )
+        self.assertEqual(
+            res["relationships"]["scores"]["links"]["self"],
+            f"/api/v1/job-posts/{self.job_post.id}/relationships/scores",
+        )
+
+
+class TestToPrimitive(SimpleTestCase):
+    def test_dates_become_iso_strings(self):
+        self.assertEqual(_to_primitive(datetime.date(2026, 5, 1)), "2026-05-01")
+        self.assertEqual(
+            _to_primitive(datetime.datetime(2026, 5, 1, 12, 30)), "2026-05-01T12:30:00"
+        )
+
+    def test_date_subclass_is_classified_on_first_sight(self):
+        class StampedDate(datetime.date):
+            pass
+
+        self.assertEqual(_to_primitive(StampedDate(2026, 5, 1)), "2026-05-01")
+        self.assertEqual(_to_primitive(StampedDate(2026, 5, 2)), "2026-05-02")
+
+    def test_decimal_and_uuid_match_drf_encoding(self):
+        self.assertEqual(_to_primitive(decimal.Decimal("123.45")), 123.45)
+        self.assertIsInstance(_to_primitive(decimal.Decimal("1")), float)
+        uid = uuid.UUID("12345678-1234-5678-1234-567812345678")
+        self.assertEqual(_to_primitive(uid), "12345678-1234-5678-1234-567812345678")
+
+    def test_other_values_pass_through(self):
+        marker = object()
+        for val in ("x", 3, 1.5, True, None, [1], {"a": 1}, marker):
+            self.assertIs(_to_primitive(val), val)
+
+
+class TestAttributesBuilder(SimpleTestCase):
+    class Row:
+        name = "Acme"
+        created_at = datetime.date(2026, 5, 1)
+        score = 7
+
+    def test_builds_primitive_attribute_dicts(self):
+        row = self.Row()
+        self.assertEqual(_attributes_builder(())(row), {})
+        self.assertEqual(_attributes_builder(("name",))(row), {"name": "Acme"})
+        self.assertEqual(
+            _attributes_builder(("score", "created_at", "name"))(row),
+            {"score": 7, "created_at": "2026-05-01", "name": "Acme"},
+        )
+
+    def test_missing_attribute_raises(self):
+        with self.assertRaises(AttributeError):
+            _attributes_builder(("name", "nope"))(self.Row())
@@ -1,6 +1,9 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
-from job_hunting.models import Summary
+from job_hunting.api.serializers import SummarySerializer
+from job_hunting.models import Resume, ResumeSummary, Summary
 
 
 class SummaryModelTests(TestCase):
@@ -23,3 +26,19 @@ class SummaryModelTests(TestCase):
     def test_job_post_id_is_plain_integer(self):
         summary = Summary.objects.create(content="Test", job_post_id=42)
         self.assertEqual(summary.job_post_id, 42)
+
+
+class SummaryUnderResumeActiveTests(TestCase):
+    def test_active_flags_loaded_with_one_query(self):
+        resume = Resume.objects.create()
+        summaries = [Summary.objects.create(content=f"s{i}") for i in range(3)]
+        ResumeSummary.objects.create(resume=resume, summary=summaries[0], active=True)
+        ResumeSummary.objects.create(resume=resume, summary=summaries[1], active=None)
+        ser = SummarySerializer()
+        ser.set_parent_context("resume", resume.id, "summaries")
+        with CaptureQueriesContext(connection) as ctx:
+            attrs = [ser.to_resource(s)["attributes"] for s in summaries]
+        self.assertEqual(len(ctx), 1)
+        self.assertIs(attrs[0]["active"], True)
+        self.assertIs(attrs[1]["active"], False)
+        self.assertNotIn("active", attrs[2])